@@ -3,21 +3,16 @@
 from __future__ import annotations
 
 import argparse
-import math
 from typing import Tuple
 
 import numpy as np
 
+from eac.chsh import DEFAULT_ANGLES
+from eac.optimize import optimal_angles
 from eac.simulate import chsh_stream
 from eac.states import load_state
 
 
-DEFAULT_ANGLES: Tuple[Tuple[float, float], Tuple[float, float]] = (
-    (0.0, math.pi / 2),
-    (math.pi / 4, -math.pi / 4),
-)
-
-
 def parse_angles(spec: str) -> Tuple[Tuple[float, float], Tuple[float, float]]:
     """Parse CLI angle specs like '0,1.571;0.785,-0.785'."""
     try:
@@ -52,28 +47,36 @@ def main() -> None:
         default="cycle",
         help="Measurement setting schedule per shot.",
     )
+    parser.add_argument(
+        "--optimize-angles",
+        action="store_true",
+        help="Replace --angles with the settings that maximise S for the chosen state.",
+    )
     parser.add_argument("--seed", type=int, default=None, help="Seed for the random generator.")
     parser.add_argument(
         "--every",
         type=int,
         default=1_000,
-        help="Print every N shots (also prints the final shot).",
+        help="Print every N shots (also prints the final shot); shots are sampled in blocks of N.",
     )
     args = parser.parse_args()
 
     rng = np.random.default_rng(args.seed)
     state = load_state(visibility=args.visibility)
+    angles = args.angles
+    if args.optimize_angles:
+        best = optimal_angles(state)
+        angles = best.angles
+        print(f"Optimal angles {angles} give S = {best.value:.4f}")
 
     for record in chsh_stream(
         state,
-        args.angles,
+        angles,
         shots=args.shots,
         schedule=args.schedule,
         rng=rng,
+        block_size=args.every,
     ):
-        should_print = record["shot"] % args.every == 0 or record["shot"] == args.shots
-        if not should_print:
-            continue
         running_s = record["running_s"]
         s_display = f"{running_s:.3f}" if running_s is not None else "n/a"
         marginals = record["marginals"]
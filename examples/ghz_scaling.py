@@ -0,0 +1,53 @@
+"""Time GHZ local-measurement sampling and Mermin tests as the party count grows."""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+
+from eac.multipartite import (
+    ghz_state,
+    local_probabilities,
+    mermin_exact,
+    mermin_local_bound,
+    mermin_value,
+    sample_local_outcomes,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-qubits", type=int, default=20, help="Largest GHZ size to time.")
+    parser.add_argument("--shots", type=int, default=100_000, help="Shots per timed sample.")
+    parser.add_argument(
+        "--terms",
+        type=int,
+        default=16,
+        help="Random Mermin terms sampled per size (all terms when fewer exist).",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Random seed.")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print("# N\tprobs_s\tsample_s\tM_exact\tM_sampled\tLHV_bound")
+    for n in range(3, args.max_qubits + 1):
+        state = ghz_state(n)
+        thetas = [np.pi / 2] * n
+        start = time.perf_counter()
+        local_probabilities(state, thetas)
+        probs_s = time.perf_counter() - start
+        start = time.perf_counter()
+        sample_local_outcomes(state, thetas, shots=args.shots, rng=rng)
+        sample_s = time.perf_counter() - start
+        m_exact = mermin_exact(state, n).value
+        m_sampled = mermin_value(state, n, shots=args.shots, terms=args.terms, rng=rng).value
+        print(
+            f"{n}\t{probs_s:.4f}\t{sample_s:.4f}\t{m_exact:.0f}\t{m_sampled:.1f}"
+            f"\t{mermin_local_bound(n):.0f}"
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    main()
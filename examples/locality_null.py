@@ -3,15 +3,11 @@
 from __future__ import annotations
 
 import argparse
-import math
-from typing import Dict, Tuple
 
 import numpy as np
 
-DEFAULT_ANGLES: Tuple[Tuple[float, float], Tuple[float, float]] = (
-    (0.0, math.pi / 2),
-    (math.pi / 4, -math.pi / 4),
-)
+from eac.chsh import DEFAULT_ANGLES
+from eac.local import lhv_counts, optimal_strategy, random_strategy
 
 
 def main() -> None:
@@ -19,6 +15,12 @@ def main() -> None:
     parser.add_argument("--shots", type=int, default=50_000, help="Number of trials.")
     parser.add_argument("--schedule", choices=("cycle", "random"), default="cycle")
     parser.add_argument("--seed", type=int, default=None, help="Random seed.")
+    parser.add_argument(
+        "--strategy",
+        choices=("random", "optimal"),
+        default="random",
+        help="LHV strategy: fair coin answers, or the deterministic S=2 assignment.",
+    )
     parser.add_argument(
         "--angles",
         type=str,
@@ -33,37 +35,9 @@ def main() -> None:
         from examples.chsh_realtime import parse_angles  # reuse parser
 
         angles = parse_angles(args.angles)
-    (a, a_prime), (b, b_prime) = angles
-    pairs = (
-        ("a", "b"),
-        ("a", "b_prime"),
-        ("a_prime", "b"),
-        ("a_prime", "b_prime"),
-    )
-    corr_sums: Dict[str, float] = {f"{p[0]}{p[1]}": 0.0 for p in pairs}
-    corr_counts: Dict[str, int] = {key: 0 for key in corr_sums}
-    labels = ("a", "a_prime", "b", "b_prime")
-
-    for shot in range(1, args.shots + 1):
-        hidden = {label: rng.choice((-1, 1)) for label in labels}
-        if args.schedule == "random":
-            pair = pairs[int(rng.integers(len(pairs)))]
-        else:
-            pair = pairs[(shot - 1) % len(pairs)]
-        key = f"{pair[0]}{pair[1]}"
-        result = hidden[pair[0]] * hidden[pair[1]]
-        corr_sums[key] += result
-        corr_counts[key] += 1
-
-    def safe_mean(key: str) -> float:
-        if corr_counts[key] == 0:
-            return float("nan")
-        return corr_sums[key] / corr_counts[key]
-
-    e_ab = safe_mean("ab")
-    e_abp = safe_mean("ab_prime")
-    e_apb = safe_mean("a_primeb")
-    e_apbp = safe_mean("a_primeb_prime")
+    strategy = optimal_strategy if args.strategy == "optimal" else random_strategy
+    counts = lhv_counts(strategy, shots=args.shots, schedule=args.schedule, rng=rng)
+    e_ab, e_abp, e_apb, e_apbp = (c.correlation for c in counts)
     s_val = e_ab + e_abp + e_apb - e_apbp
 
     print(f"Angles: Alice {angles[0]}, Bob {angles[1]}")
@@ -4,18 +4,11 @@ from __future__ import annotations
 
 import argparse
 import math
-from typing import Tuple
 
 import numpy as np
 
-from eac.chsh import chsh_value
-from eac.states import werner_state
-
-
-DEFAULT_ANGLES: Tuple[Tuple[float, float], Tuple[float, float]] = (
-    (0.0, math.pi / 2),
-    (math.pi / 4, -math.pi / 4),
-)
+from eac.chsh import DEFAULT_ANGLES
+from eac.sweep import werner_sweep
 
 
 def main() -> None:
@@ -41,12 +34,12 @@ def main() -> None:
         angles = parse_angles(args.angles)
 
     visibilities = np.linspace(args.min_v, args.max_v, args.v_grid)
-    print("# v\tS")
+    sweep = werner_sweep(visibilities, angles, shots=args.shots, rng=rng)
+    print("# v\tS\tCI95")
     crossing_v = None
-    for v in visibilities:
-        rho = werner_state(v)
-        s_est = chsh_value(rho, angles, shots=args.shots, rng=rng).value
-        print(f"{v:.4f}\t{s_est:.4f}")
+    rows = zip(sweep.visibilities, sweep.values, sweep.ci_low, sweep.ci_high)
+    for v, s_est, low, high in rows:
+        print(f"{v:.4f}\t{s_est:.4f}\t[{low:.4f}, {high:.4f}]")
         if crossing_v is None and s_est > 2.0:
             crossing_v = v
     target = 1 / math.sqrt(2)
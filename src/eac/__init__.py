@@ -1,21 +1,139 @@
 """Entanglement-as-constraint utilities."""
 
-from .states import bell_state, werner_state, as_density_matrix
-from .measure import projector, sample_outcome, observable
-from .chsh import correlation, chsh_value, check_no_signaling, correlation_exact, chsh_exact
-from .simulate import chsh_stream
+from .states import State, bell_state, werner_state, as_density_matrix, werner_structure
+from .measure import (
+    OutcomeCounts,
+    clear_operator_cache,
+    joint_probabilities,
+    joint_projectors,
+    operator_cache_info,
+    projector,
+    sample_counts,
+    sample_outcome,
+    sample_outcomes,
+    observable,
+)
+from .chsh import (
+    DEFAULT_ANGLES,
+    CorrelationResult,
+    LinearResult,
+    correlation,
+    chsh_value,
+    check_no_signaling,
+    correlation_exact,
+    chsh_exact,
+    correlation_tensor,
+    correlation_exact_grid,
+    chsh_exact_grid,
+)
+from .simulate import SequentialResult, chsh_sequential_test, chsh_stream, record_shot_log
+from .shotlog import ShotLog, ShotLogWriter
+from .packed import PackedShots, decode_shots, encode_shots
+from .compiled import CompiledCHSH
+from .sweep import SweepResult, ThresholdResult, find_werner_threshold, werner_sweep
+from .local import (
+    deterministic_strategy,
+    lhv_chsh_value,
+    lhv_counts,
+    mixed_strategy,
+    optimal_strategy,
+    random_strategy,
+)
+from .uncertainty import BootstrapResult, bootstrap, standard_error
+from .multipartite import (
+    cglmp_exact,
+    cglmp_value,
+    ghz_state,
+    local_probabilities,
+    max_entangled_qudits,
+    mermin_exact,
+    mermin_value,
+)
+from .optimize import OptimalAngles, horodecki_max, optimal_angles
+from .parallel import parallel_chsh_value, parallel_check_no_signaling, parallel_correlation
+from .aio import CHSHBroadcast, Subscription, achsh_stream
+from .window import DecayingCHSH, WindowedCHSH, drifting_werner_codes
+from .accumulate import CHSHAccumulator
+from .audit import AuditResult, audit_counts, no_signaling_audit
+from .cache import ResultCache
+from .instrument import Recorder, add_hook, instrument, remove_hook
 
 __all__ = [
+    "State",
     "as_density_matrix",
+    "werner_structure",
     "bell_state",
     "werner_state",
     "projector",
     "observable",
+    "joint_projectors",
+    "operator_cache_info",
+    "clear_operator_cache",
     "sample_outcome",
+    "sample_outcomes",
+    "joint_probabilities",
+    "sample_counts",
+    "OutcomeCounts",
+    "DEFAULT_ANGLES",
+    "CorrelationResult",
+    "LinearResult",
     "correlation",
     "chsh_value",
     "correlation_exact",
     "chsh_exact",
+    "correlation_tensor",
+    "correlation_exact_grid",
+    "chsh_exact_grid",
     "check_no_signaling",
     "chsh_stream",
+    "SequentialResult",
+    "chsh_sequential_test",
+    "record_shot_log",
+    "ShotLog",
+    "ShotLogWriter",
+    "PackedShots",
+    "encode_shots",
+    "decode_shots",
+    "CompiledCHSH",
+    "SweepResult",
+    "werner_sweep",
+    "ThresholdResult",
+    "find_werner_threshold",
+    "lhv_counts",
+    "lhv_chsh_value",
+    "random_strategy",
+    "deterministic_strategy",
+    "mixed_strategy",
+    "optimal_strategy",
+    "BootstrapResult",
+    "bootstrap",
+    "standard_error",
+    "ghz_state",
+    "max_entangled_qudits",
+    "local_probabilities",
+    "mermin_exact",
+    "mermin_value",
+    "cglmp_exact",
+    "cglmp_value",
+    "OptimalAngles",
+    "optimal_angles",
+    "horodecki_max",
+    "parallel_correlation",
+    "parallel_chsh_value",
+    "parallel_check_no_signaling",
+    "CHSHBroadcast",
+    "Subscription",
+    "achsh_stream",
+    "WindowedCHSH",
+    "DecayingCHSH",
+    "drifting_werner_codes",
+    "CHSHAccumulator",
+    "AuditResult",
+    "audit_counts",
+    "no_signaling_audit",
+    "ResultCache",
+    "Recorder",
+    "instrument",
+    "add_hook",
+    "remove_hook",
 ]
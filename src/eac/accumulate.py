@@ -0,0 +1,243 @@
+"""Checkpointable, resumable and mergeable CHSH run state.
+
+A ``CHSHAccumulator`` owns the (setting, outcome) count table for the four
+``Angles`` pairs and the generator that extends it. ``save`` writes both to a
+small JSON file, together with the schedule, a fingerprint of the state and the
+target shot count of the run in progress; ``load`` restores them, so a resumed
+run draws exactly the shots the interrupted one would have. Each shot consumes a
+fixed number of uniform draws, so the result does not depend on where blocks or
+interruptions fall. Accumulators from independent shards merge by adding their
+tables.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .chsh import Angles, CorrelationResult, _no_signaling_report
+from .measure import OUTCOMES, OutcomeCounts, _to_density, joint_probabilities
+from .packed import N_CODES, N_SETTINGS, table_correlations, table_marginals
+from .shotlog import PathLike
+from .simulate import _joint_index, _setting_pairs
+
+FORMAT = "eac-accumulator"
+VERSION = 2
+_SCHEDULES = ("cycle", "random")
+
+
+def _angles_key(angles: Angles):
+    return [[float(x) for x in angles[0]], [float(x) for x in angles[1]]]
+
+
+def _state_fingerprint(state) -> str:
+    """Hex SHA-256 of the state's density matrix, used to match checkpoints to runs."""
+    rho = np.ascontiguousarray(_to_density(state), dtype=np.complex128)
+    digest = hashlib.sha256(repr(rho.shape).encode("utf-8"))
+    digest.update(rho.tobytes())
+    return digest.hexdigest()
+
+
+class CHSHAccumulator:
+    """Running joint counts per setting, plus the RNG that produces the next shots.
+
+    Rows of ``table`` follow (a,b), (a,b'), (a',b), (a',b'); columns follow
+    ``OUTCOMES``. ``shots`` is the row total, which also fixes the position in a
+    ``"cycle"`` schedule so resumed runs continue the same setting sequence.
+    ``pending`` describes an unfinished ``run`` (schedule, state fingerprint and
+    target shot count), or is None.
+    """
+
+    def __init__(
+        self,
+        angles: Angles,
+        *,
+        table=None,
+        rng: np.random.Generator | None = None,
+    ) -> None:
+        self.angles = angles
+        self.pairs = _setting_pairs(angles)
+        if table is None:
+            table = np.zeros((N_SETTINGS, len(OUTCOMES)), dtype=np.int64)
+        table = np.array(table, dtype=np.int64)
+        if table.shape != (N_SETTINGS, len(OUTCOMES)) or np.any(table < 0):
+            raise ValueError("table must be a non-negative (4, 4) count table.")
+        self.table = table
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.pending: Optional[dict] = None
+
+    @property
+    def shots(self) -> int:
+        return int(self.table.sum())
+
+    def add_table(self, table) -> None:
+        """Add a (setting, outcome) count table, e.g. from ``ShotLog.count_table()``."""
+        table = np.asarray(table, dtype=np.int64)
+        if table.shape != self.table.shape or np.any(table < 0):
+            raise ValueError("table must be a non-negative (4, 4) count table.")
+        self.table += table
+
+    def add_codes(self, codes) -> None:
+        """Add shot codes ``setting * 4 + outcome``."""
+        codes = np.asarray(codes).ravel()
+        if codes.size and (
+            not np.issubdtype(codes.dtype, np.integer) or codes.min() < 0 or codes.max() >= N_CODES
+        ):
+            raise ValueError("Shot codes must be integers in [0, 16).")
+        counts = np.bincount(codes.astype(np.intp, copy=False), minlength=N_CODES)
+        self.table += counts.reshape(self.table.shape)
+
+    def _draw_block(self, probs: np.ndarray, size: int, schedule: str) -> np.ndarray:
+        # One uniform per shot for the outcome, plus one for the setting when the
+        # schedule is random, so the stream is the same however it is split.
+        if schedule == "random":
+            draws = self.rng.random((size, 2))
+            settings = np.minimum((draws[:, 0] * N_SETTINGS).astype(np.int64), N_SETTINGS - 1)
+            uniforms = draws[:, 1]
+        else:
+            settings = np.arange(self.shots, self.shots + size) % N_SETTINGS
+            uniforms = self.rng.random(size)
+        return settings * len(OUTCOMES) + _joint_index(probs, settings, uniforms)
+
+    def run(
+        self,
+        state,
+        shots: Optional[int] = None,
+        *,
+        block_size: int = 1_000_000,
+        schedule: str = "cycle",
+        checkpoint: Optional[PathLike] = None,
+        checkpoint_every: int = 1,
+    ) -> "CHSHAccumulator":
+        """Sample ``shots`` more shots in blocks, saving every ``checkpoint_every`` blocks.
+
+        When this accumulator holds an unfinished run (e.g. after ``load``),
+        ``shots=None`` finishes it; the state, schedule and shot count must match
+        the interrupted run, otherwise ``ValueError`` is raised.
+        """
+        if block_size < 1 or checkpoint_every < 1:
+            raise ValueError("block_size and checkpoint_every must be >= 1.")
+        if schedule not in _SCHEDULES:
+            raise ValueError("schedule must be 'cycle' or 'random'.")
+        fingerprint = _state_fingerprint(state)
+        pending = self.pending
+        if pending is not None:
+            if pending["state"] != fingerprint:
+                raise ValueError("state does not match the interrupted run.")
+            if pending["schedule"] != schedule:
+                raise ValueError(
+                    f"schedule {schedule!r} does not match the interrupted run "
+                    f"({pending['schedule']!r})."
+                )
+            if shots is None:
+                shots = pending["target"] - self.shots
+            elif self.shots + shots != pending["target"]:
+                raise ValueError(
+                    f"The interrupted run stops at {pending['target']} shots; "
+                    f"pass shots={pending['target'] - self.shots} or None."
+                )
+        elif shots is None:
+            raise ValueError("shots is required unless resuming an interrupted run.")
+        if shots < 0:
+            raise ValueError("shots must be non-negative.")
+        probs = np.stack([joint_probabilities(state, a, b) for a, b in self.pairs])
+        target = self.shots + shots
+        self.pending = {"schedule": schedule, "state": fingerprint, "target": target}
+        blocks = 0
+        while self.shots < target:
+            self.add_codes(self._draw_block(probs, min(block_size, target - self.shots), schedule))
+            blocks += 1
+            if self.shots == target:
+                self.pending = None
+            if checkpoint is not None and (blocks % checkpoint_every == 0 or not self.pending):
+                self.save(checkpoint)
+        self.pending = None
+        return self
+
+    def merge(
+        self, *others: "CHSHAccumulator", rng: np.random.Generator | None = None
+    ) -> "CHSHAccumulator":
+        """Return a new accumulator holding the summed counts.
+
+        The result gets ``rng`` (a freshly seeded generator when None), never one
+        shared with the inputs, so extending it cannot replay their draws.
+        """
+        table = self.table.copy()
+        for other in others:
+            if _angles_key(other.angles) != _angles_key(self.angles):
+                raise ValueError("Cannot merge accumulators with different angles.")
+            table += other.table
+        return CHSHAccumulator(self.angles, table=table, rng=rng)
+
+    def __add__(self, other: "CHSHAccumulator") -> "CHSHAccumulator":
+        return self.merge(other)
+
+    def counts(self) -> Tuple[OutcomeCounts, ...]:
+        return tuple(OutcomeCounts.from_array(row) for row in self.table)
+
+    def correlations(self) -> np.ndarray:
+        return table_correlations(self.table)
+
+    def marginals(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-setting P(A = +1) and P(B = +1)."""
+        return table_marginals(self.table)
+
+    def chsh_value(self) -> CorrelationResult:
+        counts = self.counts()
+        e_vals = [c.correlation for c in counts]
+        value = e_vals[0] + e_vals[1] + e_vals[2] - e_vals[3]
+        return CorrelationResult(value=float(value), shots=self.shots, counts=counts)
+
+    def no_signaling(self) -> dict:
+        """The ``check_no_signaling`` report, built from the accumulated counts."""
+        cases = self.counts()[:3]
+        return _no_signaling_report(cases, min(c.shots for c in cases))
+
+    def to_dict(self) -> dict:
+        return {
+            "format": FORMAT,
+            "version": VERSION,
+            "angles": _angles_key(self.angles),
+            "table": self.table.tolist(),
+            "rng": self.rng.bit_generator.state,
+            "pending": self.pending,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CHSHAccumulator":
+        if data.get("format") != FORMAT or data.get("version") != VERSION:
+            raise ValueError("Unsupported accumulator checkpoint.")
+        (a, a_prime), (b, b_prime) = data["angles"]
+        rng_state = data["rng"]
+        bit_generator = getattr(np.random, rng_state["bit_generator"])()
+        bit_generator.state = rng_state
+        accumulator = cls(
+            ((a, a_prime), (b, b_prime)),
+            table=data["table"],
+            rng=np.random.Generator(bit_generator),
+        )
+        pending = data.get("pending")
+        if pending is not None:
+            if set(pending) != {"schedule", "state", "target"} or (
+                int(pending["target"]) < accumulator.shots
+            ):
+                raise ValueError("Corrupt accumulator checkpoint: bad pending run.")
+            accumulator.pending = dict(pending, target=int(pending["target"]))
+        return accumulator
+
+    def save(self, path: PathLike) -> None:
+        """Write the checkpoint atomically (a temporary file, then a rename)."""
+        path = os.fspath(path)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as handle:
+            json.dump(self.to_dict(), handle)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: PathLike) -> "CHSHAccumulator":
+        with open(os.fspath(path), encoding="utf-8") as handle:
+            return cls.from_dict(json.load(handle))
@@ -0,0 +1,253 @@
+"""asyncio streaming of CHSH snapshots for live dashboards.
+
+Blocks of shots are sampled with the vectorized block sampler in an executor, so
+the event loop only hands snapshot dicts (the same records ``chsh_stream`` yields
+with ``block_size``) to subscribers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import Executor
+from typing import AsyncIterator, List, Literal, Optional
+
+import numpy as np
+
+from .chsh import Angles
+from .measure import joint_probabilities
+from .simulate import _count_blocks, _setting_pairs, _snapshot
+
+Backpressure = Literal["wait", "drop", "coalesce"]
+
+_DONE = object()
+
+
+def _next_snapshot(blocks, pairs, angles) -> Optional[dict]:
+    step = next(blocks, None)
+    if step is None:
+        return None
+    done, counts, settings, outcomes = step
+    return _snapshot(done, pairs, angles, counts, int(settings[-1]), int(outcomes[-1]))
+
+
+class Subscription:
+    """One consumer's view of a ``CHSHBroadcast``; iterate with ``async for``.
+
+    ``policy`` decides what happens when ``maxsize`` snapshots are already queued:
+    ``"wait"`` pauses the producer, ``"drop"`` discards the new snapshot and
+    ``"coalesce"`` discards the oldest queued one. Snapshots are cumulative, so
+    coalescing never loses the latest totals. ``dropped`` counts discarded snapshots.
+    """
+
+    def __init__(self, broadcast: "CHSHBroadcast", maxsize: int, policy: Backpressure) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1.")
+        if policy not in ("wait", "drop", "coalesce"):
+            raise ValueError("policy must be 'wait', 'drop' or 'coalesce'.")
+        self._broadcast = broadcast
+        # Unbounded so the end marker never displaces a snapshot; ``maxsize`` is
+        # enforced in ``_offer``. The events are created on first use inside the
+        # running loop: on Python 3.9 they bind to a loop at construction, and
+        # subscribing may happen before ``asyncio.run``.
+        self._items: deque = deque()
+        self._ready: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self.closed = False
+
+    def _push(self, item) -> None:
+        self._items.append(item)
+        if self._ready is not None:
+            self._ready.set()
+
+    async def _offer(self, item) -> None:
+        if self.closed:
+            return
+        if self.policy == "wait":
+            while len(self._items) >= self.maxsize and not self.closed:
+                if self._space is None:
+                    self._space = asyncio.Event()
+                self._space.clear()
+                await self._space.wait()
+            if self.closed:
+                return
+        elif len(self._items) >= self.maxsize:
+            if self.policy == "drop":
+                self.dropped += 1
+                return
+            self._items.popleft()
+            self.dropped += 1
+        self._push(item)
+
+    def _finish(self, item) -> None:
+        """Queue the end marker (or an error) behind the pending snapshots."""
+        self._push(item)
+
+    def close(self) -> None:
+        """Stop receiving snapshots; the producer keeps serving other subscribers."""
+        if not self.closed:
+            self.closed = True
+            self._broadcast._unsubscribe(self)
+            self._items.clear()
+            for event in (self._space, self._ready):
+                if event is not None:
+                    event.set()
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> dict:
+        while not self._items:
+            if self.closed:
+                raise StopAsyncIteration
+            if self._ready is None:
+                self._ready = asyncio.Event()
+            self._ready.clear()
+            await self._ready.wait()
+        if self.closed:
+            raise StopAsyncIteration
+        item = self._items.popleft()
+        if self._space is not None:
+            self._space.set()
+        if item is _DONE:
+            self.closed = True
+            raise StopAsyncIteration
+        if isinstance(item, BaseException):
+            self.closed = True
+            raise item
+        return item
+
+
+class CHSHBroadcast:
+    """One CHSH experiment streamed to any number of asyncio subscribers.
+
+    Each block of ``block_size`` shots is sampled in ``executor`` (the loop's
+    default executor when None) and one snapshot per block is fanned out to the
+    current subscribers. Use ``async with`` or ``start()``; ``cancel()`` stops the
+    run and ends every subscription.
+    """
+
+    def __init__(
+        self,
+        state,
+        angles: Angles,
+        *,
+        shots: int,
+        block_size: int = 10_000,
+        schedule: str = "cycle",
+        rng: np.random.Generator | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        if block_size < 1:
+            raise ValueError("block_size must be >= 1.")
+        if rng is None:
+            rng = np.random.default_rng()
+        self.angles = angles
+        self.pairs = _setting_pairs(angles)
+        self.table = np.stack([joint_probabilities(state, a, b) for a, b in self.pairs])
+        self._blocks = _count_blocks(
+            self.table, shots=shots, schedule=schedule, rng=rng, block_size=block_size
+        )
+        self._executor = executor
+        self._subscribers: List[Subscription] = []
+        self._task: Optional[asyncio.Task] = None
+        self.latest: Optional[dict] = None
+
+    def subscribe(self, *, maxsize: int = 1, policy: Backpressure = "coalesce") -> Subscription:
+        """Register a consumer; it first receives the latest snapshot, if any."""
+        subscription = Subscription(self, maxsize, policy)
+        if self._task is not None and self._task.done():
+            if self.latest is not None:
+                subscription._push(self.latest)
+            subscription._finish(_DONE)
+            return subscription
+        if self.latest is not None:
+            subscription._push(self.latest)
+        self._subscribers.append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        if subscription in self._subscribers:
+            self._subscribers.remove(subscription)
+
+    def start(self) -> asyncio.Task:
+        """Schedule the producer on the running loop (idempotent)."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self._task
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        end = _DONE
+        try:
+            while True:
+                snapshot = await loop.run_in_executor(
+                    self._executor, _next_snapshot, self._blocks, self.pairs, self.angles
+                )
+                if snapshot is None:
+                    break
+                self.latest = snapshot
+                for subscription in list(self._subscribers):
+                    await subscription._offer(snapshot)
+        except Exception as exc:
+            end = exc
+            raise
+        finally:
+            for subscription in self._subscribers:
+                subscription._finish(end)
+            self._subscribers.clear()
+
+    async def wait(self) -> Optional[dict]:
+        """Run to completion and return the final snapshot."""
+        await self.start()
+        return self.latest
+
+    def cancel(self) -> None:
+        """Stop sampling after the block in flight; subscribers see end of stream."""
+        if self._task is not None:
+            self._task.cancel()
+
+    async def __aenter__(self) -> "CHSHBroadcast":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.cancel()
+        await asyncio.wait([self._task])
+        if exc_type is None and not self._task.cancelled() and self._task.exception():
+            raise self._task.exception()
+
+
+async def achsh_stream(
+    state,
+    angles: Angles,
+    *,
+    shots: int,
+    block_size: int = 10_000,
+    schedule: str = "cycle",
+    rng: np.random.Generator | None = None,
+    executor: Executor | None = None,
+    maxsize: int = 1,
+    policy: Backpressure = "wait",
+) -> AsyncIterator[dict]:
+    """Async counterpart of ``chsh_stream(..., block_size=...)`` for a single consumer.
+
+    With the default ``policy="wait"`` every block's snapshot is delivered; pass
+    ``"coalesce"`` to skip ahead to the latest totals when the consumer lags.
+    """
+    broadcast = CHSHBroadcast(
+        state,
+        angles,
+        shots=shots,
+        block_size=block_size,
+        schedule=schedule,
+        rng=rng,
+        executor=executor,
+    )
+    subscription = broadcast.subscribe(maxsize=maxsize, policy=policy)
+    async with broadcast:
+        async for snapshot in subscription:
+            yield snapshot
@@ -0,0 +1,274 @@
+"""Benchmark runner for the sampling, streaming, exact and sweep hot paths.
+
+Run ``python -m eac.bench --out bench.json`` to time every case across shot
+counts from 10^3 to 10^7. Each case reports the shots it actually drew (which
+can fall a little short of the requested count when it splits shots evenly over
+settings or visibilities), throughput in shots/s and the peak traced memory.
+Exact cases draw no shots; they run 10 to 1000 evaluations and report
+evaluations/s. Pass ``--compare baseline.json`` to flag regressions against an
+earlier run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .chsh import DEFAULT_ANGLES, check_no_signaling, chsh_exact, chsh_value, correlation
+from .measure import sample_outcome, sample_outcomes
+from .simulate import chsh_stream
+from .states import werner_state
+from .sweep import werner_sweep
+from .window import WindowedCHSH, drifting_werner_codes
+
+DEFAULT_SHOTS = (10**3, 10**4, 10**5, 10**6, 10**7)
+DEFAULT_EVALUATIONS = (10, 100, 1_000)
+
+
+@dataclass
+class BenchCase:
+    """``run(size, rng)`` where size is a shot count, or an evaluation count for exact cases.
+
+    ``drawn(size)`` gives the shots a run really draws when that differs from ``size``.
+    """
+
+    name: str
+    run: Callable[[int, np.random.Generator], None]
+    max_shots: Optional[int] = None
+    exact: bool = False
+    drawn: Optional[Callable[[int], int]] = None
+
+
+@dataclass
+class BenchResult:
+    name: str
+    shots: int
+    seconds: float
+    shots_per_second: Optional[float]
+    peak_bytes: int
+    evaluations: int = 0
+    evaluations_per_second: Optional[float] = None
+
+    @property
+    def throughput(self) -> float:
+        """Shots/s for sampling cases, evaluations/s for exact ones."""
+        if self.shots_per_second is not None:
+            return self.shots_per_second
+        return self.evaluations_per_second
+
+
+def _per_shot_samples(shots: int, rng: np.random.Generator) -> None:
+    state = werner_state(0.9)
+    for _ in range(shots):
+        sample_outcome(state, 0.0, np.pi / 4, rng=rng)
+
+
+def _drain(iterator) -> None:
+    for _ in iterator:
+        pass
+
+
+def _windowed_drift(shots: int, rng: np.random.Generator) -> None:
+    estimator = WindowedCHSH(DEFAULT_ANGLES, window=100_000)
+    drift = lambda t: 1.0 - 0.5 * t / shots  # noqa: E731
+    for codes in drifting_werner_codes(drift, DEFAULT_ANGLES, shots=shots, rng=rng):
+        estimator.update(codes)
+
+
+def default_cases() -> List[BenchCase]:
+    """Cases covering each hot path; ``shots`` is the total number of trials."""
+    state = werner_state(0.9)
+    # Not a Werner state, so exact evaluation goes through the density-matrix path.
+    general = np.array([np.cos(0.3), 0.0, 0.0, np.sin(0.3)], dtype=np.complex128)
+    general = np.outer(general, general.conj())
+    angles = DEFAULT_ANGLES
+    sweep_v = np.linspace(0.0, 1.0, 101)
+    return [
+        BenchCase("sample_outcome", _per_shot_samples, max_shots=10**4),
+        BenchCase(
+            "sample_outcomes",
+            lambda shots, rng: sample_outcomes(state, 0.0, np.pi / 4, shots, rng=rng),
+        ),
+        BenchCase(
+            "correlation",
+            lambda shots, rng: correlation(state, 0.0, np.pi / 4, shots=shots, rng=rng),
+        ),
+        BenchCase(
+            "chsh_value",
+            lambda shots, rng: chsh_value(state, angles, shots=max(1, shots // 4), rng=rng),
+            drawn=lambda shots: 4 * max(1, shots // 4),
+        ),
+        BenchCase(
+            "check_no_signaling",
+            lambda shots, rng: check_no_signaling(state, angles, shots=max(3, shots), rng=rng),
+            drawn=lambda shots: 3 * (max(3, shots) // 3),
+        ),
+        BenchCase(
+            "chsh_stream[per_shot]",
+            lambda shots, rng: _drain(chsh_stream(state, angles, shots=shots, rng=rng)),
+            max_shots=10**4,
+        ),
+        BenchCase(
+            "chsh_stream[block]",
+            lambda shots, rng: _drain(
+                chsh_stream(state, angles, shots=shots, rng=rng, block_size=100_000)
+            ),
+        ),
+        BenchCase("windowed_drift", _windowed_drift),
+        BenchCase(
+            "chsh_exact[werner]",
+            lambda count, rng: [chsh_exact(state, angles) for _ in range(count)],
+            exact=True,
+        ),
+        BenchCase(
+            "chsh_exact[density]",
+            lambda count, rng: [chsh_exact(general, angles) for _ in range(count)],
+            exact=True,
+        ),
+        BenchCase(
+            "werner_sweep",
+            lambda shots, rng: werner_sweep(
+                sweep_v, angles, shots=max(1, shots // (4 * len(sweep_v))), rng=rng
+            ),
+            drawn=lambda shots: 4 * len(sweep_v) * max(1, shots // (4 * len(sweep_v))),
+        ),
+    ]
+
+
+def run_benchmarks(
+    cases: Optional[Sequence[BenchCase]] = None,
+    *,
+    shot_counts: Sequence[int] = DEFAULT_SHOTS,
+    evaluation_counts: Sequence[int] = DEFAULT_EVALUATIONS,
+    repeat: int = 3,
+    seed: int = 0,
+) -> List[BenchResult]:
+    """Time every case at every size (best of ``repeat``) and trace peak memory.
+
+    Sampling cases run at ``shot_counts`` and report shots/s. Exact cases draw no
+    shots, so they run at ``evaluation_counts`` and report evaluations/s.
+    """
+    results = []
+    for case in cases if cases is not None else default_cases():
+        for size in evaluation_counts if case.exact else shot_counts:
+            if case.max_shots is not None and size > case.max_shots:
+                continue
+            rng = np.random.default_rng(seed)
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                case.run(size, rng)
+                best = min(best, time.perf_counter() - start)
+            tracemalloc.start()
+            try:
+                case.run(size, rng)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            count = case.drawn(size) if case.drawn is not None else size
+            rate = count / best if best > 0 else float("inf")
+            results.append(
+                BenchResult(
+                    name=case.name,
+                    shots=0 if case.exact else count,
+                    seconds=best,
+                    shots_per_second=None if case.exact else rate,
+                    peak_bytes=int(peak),
+                    evaluations=size if case.exact else 0,
+                    evaluations_per_second=rate if case.exact else None,
+                )
+            )
+    return results
+
+
+def to_json(results: Sequence[BenchResult]) -> Dict[str, object]:
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def compare(baseline: Dict[str, object], current: Dict[str, object], *, tolerance: float = 0.2):
+    """Return (name, size, ratio) for cases whose throughput fell by more than ``tolerance``.
+
+    Size is the shot count, or the evaluation count for exact cases.
+    """
+
+    def size(result) -> int:
+        return result["shots"] or result.get("evaluations", 0)
+
+    def rate(result) -> float:
+        if result.get("shots_per_second") is not None:
+            return result["shots_per_second"]
+        return result["evaluations_per_second"]
+
+    previous = {(r["name"], size(r)): r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        old = previous.get((result["name"], size(result)))
+        if old is None:
+            continue
+        ratio = rate(result) / rate(old)
+        if ratio < 1.0 - tolerance:
+            regressions.append((result["name"], size(result), ratio))
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--out", type=str, default=None, help="Write JSON results here.")
+    parser.add_argument(
+        "--shots",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SHOTS),
+        help="Shot counts to time (default 10^3 .. 10^7).",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repeats (best is kept).")
+    parser.add_argument("--only", type=str, nargs="*", default=None, help="Case names to run.")
+    parser.add_argument("--compare", type=str, default=None, help="Baseline JSON to compare.")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Allowed fractional throughput drop."
+    )
+    args = parser.parse_args(argv)
+
+    cases = default_cases()
+    if args.only:
+        cases = [case for case in cases if case.name in args.only]
+    results = run_benchmarks(cases, shot_counts=args.shots, repeat=args.repeat)
+    report = to_json(results)
+    print(f"{'case':<24}{'size':>10}{'seconds':>12}{'per second':>14}{'peak MB':>10}  unit")
+    for r in results:
+        unit = "evaluations" if r.shots_per_second is None else "shots"
+        print(
+            f"{r.name:<24}{r.shots or r.evaluations:>10}{r.seconds:>12.5f}"
+            f"{r.throughput:>14.3e}{r.peak_bytes / 1e6:>10.2f}  {unit}"
+        )
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = compare(baseline, report, tolerance=args.tolerance)
+        for name, size, ratio in regressions:
+            print(f"REGRESSION {name} @ {size}: {ratio:.2f}x baseline throughput")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entry point
+    raise SystemExit(main())
@@ -0,0 +1,227 @@
+"""Opt-in, content-addressed on-disk cache for exact and seeded results.
+
+Entries are keyed by a SHA-256 over the cache format, ``RESULTS_VERSION``, the
+function name, the density-matrix bytes, the angles, shots, schedule, seed and
+any extra parameters. Each entry is one pickle file, written atomically, under a
+per-version subdirectory. Hits refresh the file's mtime, and the whole cache
+root, every version included, is trimmed to ``max_bytes`` by evicting the least
+recently used files, so entries from old versions age out rather than being
+deleted by whichever version opens the cache. An entry that cannot be unpickled
+counts as a miss. Only point the cache at a directory you trust, since entries
+are unpickled.
+
+Sampled results are cached only when a ``seed`` is given: a seeded run is
+reproducible, while an unseeded one must always sample.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from .chsh import Angles, CorrelationResult, chsh_exact, chsh_value
+from .measure import _to_density
+from .shotlog import PathLike
+from .states import BellLabel
+from .sweep import SweepResult, werner_sweep
+
+CACHE_FORMAT = 1
+# Bump whenever a cached function's output changes for the same inputs (e.g. the
+# sampler consumes the generator differently), so stale results are never served.
+RESULTS_VERSION = 1
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+_VERSION_PREFIX = "eac-cache-v"
+
+
+def default_cache_dir() -> str:
+    """``$EAC_CACHE_DIR``, else ``~/.cache/eac``."""
+    return os.environ.get("EAC_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "eac"
+    )
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return {"shape": list(value.shape), "data": value.astype(float).ravel().tolist()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class ResultCache:
+    """A size-bounded LRU cache of results under ``directory``."""
+
+    def __init__(
+        self,
+        directory: Optional[PathLike] = None,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        version: str = f"{CACHE_FORMAT}-{RESULTS_VERSION}",
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative.")
+        self.root = os.fspath(directory) if directory is not None else default_cache_dir()
+        self.version = version
+        self.max_bytes = int(max_bytes)
+        self.directory = os.path.join(self.root, _VERSION_PREFIX + version)
+        os.makedirs(self.directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def key(
+        self,
+        name: str,
+        *,
+        state=None,
+        angles: Optional[Angles] = None,
+        shots: Optional[int] = None,
+        schedule: Optional[str] = None,
+        seed: Optional[int] = None,
+        **extra: Any,
+    ) -> str:
+        """Hex SHA-256 identifying one computation."""
+        digest = hashlib.sha256(f"{self.version}:{name}".encode("utf-8"))
+        if state is not None:
+            rho = np.ascontiguousarray(_to_density(state), dtype=np.complex128)
+            digest.update(repr(rho.shape).encode("utf-8"))
+            digest.update(rho.tobytes())
+        params = {
+            "angles": _plain(angles),
+            "shots": shots,
+            "schedule": schedule,
+            "seed": seed,
+            "extra": {k: _plain(v) for k, v in extra.items()},
+        }
+        digest.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".pkl")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as handle:
+                value = pickle.load(handle)
+        except Exception:
+            # Missing, truncated or unloadable (e.g. a class that moved): recompute.
+            self.misses += 1
+            return default
+        os.utime(path)
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as handle:
+            pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        self.evict()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def _entries(self):
+        for version in os.scandir(self.root):
+            if version.is_dir() and version.name.startswith(_VERSION_PREFIX):
+                for entry in os.scandir(version.path):
+                    if entry.name.endswith(".pkl"):
+                        yield entry
+
+    def size(self) -> int:
+        """Bytes used by entries of every version under ``root``."""
+        return sum(entry.stat().st_size for entry in self._entries())
+
+    def evict(self) -> None:
+        """Delete least recently used entries, of any version, to fit in ``max_bytes``."""
+        entries = []
+        for entry in self._entries():
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        for entry in os.scandir(self.directory):
+            os.remove(entry.path)
+
+    def chsh_exact(self, state, angles: Angles) -> CorrelationResult:
+        key = self.key("chsh_exact", state=state, angles=angles)
+        return self.get_or_compute(key, lambda: chsh_exact(state, angles))
+
+    def chsh_value(
+        self,
+        state,
+        angles: Angles,
+        *,
+        shots: int = 10_000,
+        seed: Optional[int] = None,
+    ) -> CorrelationResult:
+        """``chsh_value`` with ``rng=default_rng(seed)``; cached only when seeded."""
+
+        def compute() -> CorrelationResult:
+            return chsh_value(state, angles, shots=shots, rng=np.random.default_rng(seed))
+
+        if seed is None:
+            return compute()
+        key = self.key("chsh_value", state=state, angles=angles, shots=shots, seed=seed)
+        return self.get_or_compute(key, compute)
+
+    def werner_sweep(
+        self,
+        visibilities,
+        angles: Angles,
+        *,
+        shots: int = 20_000,
+        seed: Optional[int] = None,
+        singlet: BellLabel = "Phi+",
+        confidence: float = 0.95,
+    ) -> SweepResult:
+        """``werner_sweep`` with ``rng=default_rng(seed)``; cached only when seeded."""
+        visibilities = np.asarray(visibilities, dtype=float)
+
+        def compute() -> SweepResult:
+            return werner_sweep(
+                visibilities,
+                angles,
+                shots=shots,
+                rng=np.random.default_rng(seed),
+                singlet=singlet,
+                confidence=confidence,
+            )
+
+        if seed is None:
+            return compute()
+        key = self.key(
+            "werner_sweep",
+            angles=angles,
+            shots=shots,
+            seed=seed,
+            visibilities=visibilities,
+            singlet=singlet,
+            confidence=confidence,
+        )
+        return self.get_or_compute(key, compute)
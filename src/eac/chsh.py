@@ -2,22 +2,71 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Optional, Sequence, Tuple
 
 import numpy as np
 
-from .measure import observable, sample_outcome
-from .states import as_density_matrix
+from .audit import _two_proportion_test
+from .instrument import stage
+from .measure import (
+    OUTCOMES,
+    Angles,
+    OutcomeCounts,
+    joint_projectors,
+    sample_counts,
+    werner_correlation,
+)
+from .shotlog import ShotLog
+from .states import State, as_density_matrix, werner_structure
 
 
-Angles = Tuple[Tuple[float, float], Tuple[float, float]]
+# Tsirelson-optimal settings for |Φ+⟩ under projector()'s convention.
+DEFAULT_ANGLES: Angles = (
+    (0.0, math.pi / 2),
+    (math.pi / 4, -math.pi / 4),
+)
+
+_PRODUCT_SIGNS = np.array([a * b for a, b in OUTCOMES], dtype=float)
 
 
 @dataclass
 class CorrelationResult:
     value: float
     shots: int
+    counts: Tuple[OutcomeCounts, ...] = ()
+
+
+@dataclass(eq=False)
+class LinearResult(CorrelationResult):
+    """A sampled value that is linear in per-case outcome frequencies.
+
+    ``case_counts`` is an integer (case, outcome) array and ``value`` equals
+    ``sum(weights * case_counts / case_counts.sum(axis=1, keepdims=True))``, which
+    lets ``eac.uncertainty`` resample it like the two-party results. ``counts``
+    stays empty: the outcomes here are not two-party ``OutcomeCounts``.
+    """
+
+    case_counts: Optional[np.ndarray] = None
+    weights: Optional[np.ndarray] = None
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.value == other.value
+            and self.shots == other.shots
+            and self.counts == other.counts
+            and _optional_array_equal(self.case_counts, other.case_counts)
+            and _optional_array_equal(self.weights, other.weights)
+        )
+
+
+def _optional_array_equal(left: Optional[np.ndarray], right: Optional[np.ndarray]) -> bool:
+    if left is None or right is None:
+        return left is right
+    return bool(np.array_equal(left, right))
 
 
 def correlation(
@@ -28,14 +77,19 @@ def correlation(
     shots: int = 10_000,
     rng: np.random.Generator | None = None,
 ) -> CorrelationResult:
-    """Estimate E(theta_a, theta_b) = ⟨A B⟩."""
+    """Estimate E(theta_a, theta_b) = ⟨A B⟩.
+
+    ``state`` may also be a ``ShotLog``; the recorded shots for the setting (from
+    every row recorded with it) are then replayed and ``shots``/``rng`` are ignored.
+    """
+    if isinstance(state, ShotLog):
+        counts = state.pair_counts(theta_a, theta_b)
+        return CorrelationResult(value=counts.correlation, shots=counts.shots, counts=(counts,))
     if rng is None:
         rng = np.random.default_rng()
-    outcomes = np.empty(shots, dtype=float)
-    for i in range(shots):
-        a, b = sample_outcome(state, theta_a, theta_b, rng=rng)
-        outcomes[i] = a * b
-    return CorrelationResult(value=float(outcomes.mean()), shots=shots)
+    with stage("chsh.correlation", shots):
+        counts = sample_counts(state, theta_a, theta_b, shots, rng=rng)
+    return CorrelationResult(value=counts.correlation, shots=shots, counts=(counts,))
 
 
 def correlation_exact(
@@ -45,10 +99,13 @@ def correlation_exact(
 ) -> CorrelationResult:
     """Exact expectation value ⟨A B⟩ without sampling."""
     rho = as_density_matrix(state)
-    a_op = observable(theta_a)
-    b_op = observable(theta_b)
-    op = np.kron(a_op, b_op)
-    value = float(np.real(np.trace(op @ rho)))
+    structure = werner_structure(state if isinstance(state, State) else rho)
+    if structure is not None:
+        value = float(werner_correlation(structure[0], structure[1], theta_a, theta_b))
+        return CorrelationResult(value=value, shots=0)
+    ops = joint_projectors(theta_a, theta_b)
+    probs = np.real(np.einsum("kij,ji->k", ops, rho))
+    value = float(probs @ _PRODUCT_SIGNS)
     return CorrelationResult(value=value, shots=0)
 
 
@@ -59,21 +116,32 @@ def chsh_value(
     shots: int = 10_000,
     rng: np.random.Generator | None = None,
 ) -> CorrelationResult:
-    """Estimate the CHSH S value for the specified angles."""
+    """Estimate the CHSH S value for the specified angles (or replay a ``ShotLog``)."""
+    if isinstance(state, ShotLog):
+        state.check_angles(angles)
+        counts = state.setting_counts()
+        e_vals = [c.correlation for c in counts]
+        value = e_vals[0] + e_vals[1] + e_vals[2] - e_vals[3]
+        return CorrelationResult(
+            value=float(value), shots=sum(c.shots for c in counts), counts=counts
+        )
     if rng is None:
         rng = np.random.default_rng()
     (a, a_prime), (b, b_prime) = angles
-    corr_ab = correlation(state, a, b, shots=shots, rng=rng)
-    corr_abp = correlation(state, a, b_prime, shots=shots, rng=rng)
-    corr_apb = correlation(state, a_prime, b, shots=shots, rng=rng)
-    corr_apbp = correlation(state, a_prime, b_prime, shots=shots, rng=rng)
+    with stage("chsh.value", 4 * shots):
+        corr_ab = correlation(state, a, b, shots=shots, rng=rng)
+        corr_abp = correlation(state, a, b_prime, shots=shots, rng=rng)
+        corr_apb = correlation(state, a_prime, b, shots=shots, rng=rng)
+        corr_apbp = correlation(state, a_prime, b_prime, shots=shots, rng=rng)
     value = (
         corr_ab.value
         + corr_abp.value
         + corr_apb.value
         - corr_apbp.value
     )
-    return CorrelationResult(value=float(value), shots=4 * shots)
+    counts = corr_ab.counts + corr_abp.counts + corr_apb.counts + corr_apbp.counts
+    total = sum(c.shots for c in counts)
+    return CorrelationResult(value=float(value), shots=total, counts=counts)
 
 
 def chsh_exact(
@@ -95,58 +163,129 @@ def chsh_exact(
     return CorrelationResult(value=float(value), shots=0)
 
 
-def _marginal_probability(
-    state,
-    theta_a: float,
-    theta_b: float,
-    *,
-    shots: int,
-    target: str,
-    rng: np.random.Generator,
-) -> float:
-    hits = 0
-    for _ in range(shots):
-        a, b = sample_outcome(state, theta_a, theta_b, rng=rng)
-        if target == "alice" and a == +1:
-            hits += 1
-        if target == "bob" and b == +1:
-            hits += 1
-    return hits / shots
+_PAULI_ZX = np.array(
+    [
+        [[1.0, 0.0], [0.0, -1.0]],
+        [[0.0, 1.0], [1.0, 0.0]],
+    ],
+    dtype=np.complex128,
+)
 
 
-def check_no_signaling(
-    state,
-    angles: Angles,
-    *,
-    shots: int = 20_000,
-    rng: np.random.Generator | None = None,
-):
-    """Return marginal probabilities for Alice and Bob under setting changes."""
-    if shots < 4:
-        raise ValueError("shots must be >= 4 to run the no-signaling check.")
-    if rng is None:
-        rng = np.random.default_rng()
+def _density_stack(states) -> np.ndarray:
+    if isinstance(states, State):
+        return states.rho
+    states = np.asarray(states, dtype=np.complex128)
+    if states.ndim <= 2:
+        return as_density_matrix(states)
+    if states.shape[-2:] != (4, 4):
+        raise ValueError("State stacks must have shape (..., 4, 4).")
+    return states
+
+
+def correlation_tensor(states) -> np.ndarray:
+    """Return T[..., i, j] = ⟨σ_i ⊗ σ_j⟩ for i, j in (z, x).
+
+    Accepts a single state or a stack of density matrices with shape (..., 4, 4).
+    With ``projector(theta)``'s convention A(θ) = cos θ σ_z + sin θ σ_x, so
+    E(a, b) = (cos a, sin a) · T · (cos b, sin b).
+    """
+    rho = _density_stack(states)
+    rho4 = rho.reshape(rho.shape[:-2] + (2, 2, 2, 2))
+    tensor = np.einsum("...ijkl,mki,nlj->...mn", rho4, _PAULI_ZX, _PAULI_ZX)
+    return np.real(tensor)
+
+
+def correlation_exact_grid(states, theta_a, theta_b) -> np.ndarray:
+    """Exact E over broadcast arrays of angles and an optional stack of states.
+
+    The result has shape ``states_batch_shape + broadcast(theta_a, theta_b).shape``.
+    """
+    tensor = correlation_tensor(states)
+    theta_a, theta_b = np.broadcast_arrays(
+        np.asarray(theta_a, dtype=float), np.asarray(theta_b, dtype=float)
+    )
+    u = np.stack([np.cos(theta_a), np.sin(theta_a)], axis=-1).reshape(-1, 2)
+    w = np.stack([np.cos(theta_b), np.sin(theta_b)], axis=-1).reshape(-1, 2)
+    values = np.einsum("...ij,gi,gj->...g", tensor, u, w)
+    return values.reshape(tensor.shape[:-2] + theta_a.shape)
+
+
+def chsh_exact_grid(states, angles) -> np.ndarray:
+    """Exact CHSH S over broadcast angle arrays ``((a, a'), (b, b'))`` and states."""
     (a, a_prime), (b, b_prime) = angles
-    per_case = max(1, shots // 4)
-    alice_p = {
-        "b": _marginal_probability(state, a, b, shots=per_case, target="alice", rng=rng),
-        "b_prime": _marginal_probability(
-            state, a, b_prime, shots=per_case, target="alice", rng=rng
-        ),
-    }
-    bob_p = {
-        "a": _marginal_probability(state, a, b, shots=per_case, target="bob", rng=rng),
-        "a_prime": _marginal_probability(
-            state, a_prime, b, shots=per_case, target="bob", rng=rng
-        ),
-    }
+    a, a_prime, b, b_prime = np.broadcast_arrays(
+        *(np.asarray(theta, dtype=float) for theta in (a, a_prime, b, b_prime))
+    )
+    tensor = correlation_tensor(states)
+    alice = np.stack([np.cos(a), np.sin(a)], axis=-1).reshape(-1, 2)
+    alice_p = np.stack([np.cos(a_prime), np.sin(a_prime)], axis=-1).reshape(-1, 2)
+    bob = np.stack([np.cos(b), np.sin(b)], axis=-1).reshape(-1, 2)
+    bob_p = np.stack([np.cos(b_prime), np.sin(b_prime)], axis=-1).reshape(-1, 2)
+    # S = a·T(b + b') + a'·T(b - b')
+    values = np.einsum("...ij,gi,gj->...g", tensor, alice, bob + bob_p) + np.einsum(
+        "...ij,gi,gj->...g", tensor, alice_p, bob - bob_p
+    )
+    return values.reshape(tensor.shape[:-2] + a.shape)
+
+
+def _no_signaling_report(cases: Sequence[OutcomeCounts], per_case: int) -> dict:
+    """Build the no-signaling report from counts for (a,b), (a,b'), (a',b).
+
+    Alice's and Bob's marginals both come from the one (a,b) table; the z
+    statistics and p-values are the same two-proportion tests ``eac.audit`` runs.
+    """
+    ab, ab_prime, a_prime_b = cases
+    alice_p = {"b": ab.alice_plus, "b_prime": ab_prime.alice_plus}
+    bob_p = {"a": ab.bob_plus, "a_prime": a_prime_b.bob_plus}
     deviation = max(
         abs(alice_p["b"] - alice_p["b_prime"]),
         abs(bob_p["a"] - bob_p["a_prime"]),
     )
+    plus = [
+        [ab.plus_plus + ab.plus_minus, ab_prime.plus_plus + ab_prime.plus_minus],
+        [ab.plus_plus + ab.minus_plus, a_prime_b.plus_plus + a_prime_b.minus_plus],
+    ]
+    n = [[ab.shots, ab_prime.shots], [ab.shots, a_prime_b.shots]]
+    _, z, p_values = _two_proportion_test(plus, n)
     return {
         "alice": alice_p,
         "bob": bob_p,
         "max_deviation": deviation,
+        "z": {"alice": float(z[0]), "bob": float(z[1])},
+        "p_values": {"alice": float(p_values[0]), "bob": float(p_values[1])},
         "shots_per_case": per_case,
+        "counts": tuple(cases),
     }
+
+
+def check_no_signaling(
+    state,
+    angles: Angles,
+    *,
+    shots: int = 20_000,
+    rng: np.random.Generator | None = None,
+):
+    """Return marginal probabilities for Alice and Bob under setting changes.
+
+    ``shots`` is split evenly over (a,b), (a,b') and (a',b); Alice compares the
+    first two and Bob the first and last, so every shot feeds a comparison. With
+    a ``ShotLog`` the recorded counts are replayed instead of sampling.
+    """
+    (a, a_prime), (b, b_prime) = angles
+    settings = ((a, b), (a, b_prime), (a_prime, b))
+    if isinstance(state, ShotLog):
+        state.check_angles(angles)
+        cases = state.setting_counts()[:3]
+        return _no_signaling_report(cases, min(c.shots for c in cases))
+    if shots < 3:
+        raise ValueError("shots must be >= 3 to run the no-signaling check.")
+    if rng is None:
+        rng = np.random.default_rng()
+    per_case = shots // 3
+    with stage("chsh.no_signaling", 3 * per_case):
+        cases = [
+            sample_counts(state, theta_a, theta_b, per_case, rng=rng)
+            for theta_a, theta_b in settings
+        ]
+    return _no_signaling_report(cases, per_case)
@@ -0,0 +1,113 @@
+"""Precompiled CHSH experiments for repeated runs on one configuration."""
+
+from __future__ import annotations
+
+from typing import Generator, Tuple
+
+import numpy as np
+
+from .chsh import _PRODUCT_SIGNS, Angles, CorrelationResult, _no_signaling_report
+from .measure import OUTCOMES, OutcomeCounts, _to_density, joint_probabilities
+from .simulate import _draw_joint, _draw_settings, _setting_pairs, _stream_table
+
+
+class CompiledCHSH:
+    """A state and ``Angles`` pair with the joint probability table built once.
+
+    Rows of ``table`` follow the settings (a,b), (a,b'), (a',b), (a',b'); columns
+    follow ``OUTCOMES``. Every method after construction is a table lookup plus
+    RNG draws.
+    """
+
+    def __init__(self, state, angles: Angles) -> None:
+        self.rho = _to_density(state)
+        self.angles = angles
+        self.pairs = _setting_pairs(angles)
+        table = np.stack([joint_probabilities(self.rho, a, b) for a, b in self.pairs])
+        table.setflags(write=False)
+        self.table = table
+
+    def exact(self) -> CorrelationResult:
+        """Exact CHSH value from the probability table."""
+        e_vals = self.table @ _PRODUCT_SIGNS
+        value = e_vals[0] + e_vals[1] + e_vals[2] - e_vals[3]
+        return CorrelationResult(value=float(value), shots=0)
+
+    def counts(
+        self,
+        shots: int,
+        rng: np.random.Generator | None = None,
+    ) -> Tuple[OutcomeCounts, ...]:
+        """Draw ``shots`` outcomes for each setting and return the four count records."""
+        if shots < 0:
+            raise ValueError("shots must be non-negative.")
+        if rng is None:
+            rng = np.random.default_rng()
+        draws = rng.multinomial(shots, self.table)
+        return tuple(OutcomeCounts.from_array(row) for row in draws)
+
+    def chsh_value(
+        self,
+        *,
+        shots: int = 10_000,
+        rng: np.random.Generator | None = None,
+    ) -> CorrelationResult:
+        """Estimate S with ``shots`` per setting, mirroring ``eac.chsh.chsh_value``."""
+        counts = self.counts(shots, rng=rng)
+        e_vals = [c.correlation for c in counts]
+        value = e_vals[0] + e_vals[1] + e_vals[2] - e_vals[3]
+        return CorrelationResult(value=float(value), shots=4 * shots, counts=counts)
+
+    def sample(
+        self,
+        shots: int,
+        *,
+        schedule: str = "cycle",
+        rng: np.random.Generator | None = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Draw per-shot setting indices and Alice's and Bob's ±1 outcomes."""
+        if shots < 0:
+            raise ValueError("shots must be non-negative.")
+        if rng is None:
+            rng = np.random.default_rng()
+        settings = _draw_settings(0, shots, len(self.pairs), schedule, rng)
+        index = _draw_joint(self.table, settings, rng)
+        outcomes = np.array(OUTCOMES, dtype=np.int8)
+        return settings.astype(np.int8), outcomes[index, 0], outcomes[index, 1]
+
+    def stream(
+        self,
+        *,
+        shots: int,
+        schedule: str = "cycle",
+        rng: np.random.Generator | None = None,
+        block_size: int = 1_000,
+    ) -> Generator[dict, None, None]:
+        """Yield ``chsh_stream``-style snapshots once per block of shots."""
+        if rng is None:
+            rng = np.random.default_rng()
+        yield from _stream_table(
+            self.table,
+            self.angles,
+            shots=shots,
+            schedule=schedule,
+            rng=rng,
+            block_size=block_size,
+        )
+
+    def no_signaling(
+        self,
+        *,
+        shots: int = 20_000,
+        rng: np.random.Generator | None = None,
+    ) -> dict:
+        """Same report as ``eac.chsh.check_no_signaling`` drawn from the table."""
+        if shots < 3:
+            raise ValueError("shots must be >= 3 to run the no-signaling check.")
+        if rng is None:
+            rng = np.random.default_rng()
+        per_case = shots // 3
+        # Alice compares (a,b) with (a,b'); Bob compares the same (a,b) with (a',b).
+        draws = rng.multinomial(per_case, self.table[:3])
+        cases = [OutcomeCounts.from_array(row) for row in draws]
+        return _no_signaling_report(cases, per_case)
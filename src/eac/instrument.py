@@ -0,0 +1,123 @@
+"""Opt-in per-stage timing counters for the hot paths.
+
+Stages record call counts, cumulative wall time and shots processed. Nothing
+is recorded until a recorder is active (``with instrument() as rec:``) or a hook
+is registered (``add_hook``). While disabled, ``stage()`` costs one global check
+and returns a shared no-op context. Timings are inclusive, so nested stages
+also count toward their callers.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List
+
+Hook = Callable[[str, float, int], None]
+
+_recorders: List["Recorder"] = []
+_hooks: List[Hook] = []
+_enabled = False
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    seconds: float = 0.0
+    shots: int = 0
+
+
+class Recorder:
+    """Accumulates ``StageStats`` per stage name."""
+
+    def __init__(self) -> None:
+        self.stats: Dict[str, StageStats] = {}
+
+    def record(self, name: str, seconds: float, shots: int) -> None:
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = StageStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.shots += shots
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        return {
+            name: {"calls": s.calls, "seconds": s.seconds, "shots": s.shots}
+            for name, s in sorted(self.stats.items())
+        }
+
+
+class _Span:
+    __slots__ = ("name", "shots", "start")
+
+    def __init__(self, name: str, shots: int) -> None:
+        self.name = name
+        self.shots = shots
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        elapsed = time.perf_counter() - self.start
+        for recorder in _recorders:
+            recorder.record(self.name, elapsed, self.shots)
+        for hook in _hooks:
+            hook(self.name, elapsed, self.shots)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def stage(name: str, shots: int = 0):
+    """Context manager timing one pass through ``name``; a no-op when disabled."""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, shots)
+
+
+def _refresh() -> None:
+    global _enabled
+    _enabled = bool(_recorders or _hooks)
+
+
+@contextmanager
+def instrument() -> Iterator[Recorder]:
+    """Record every stage while the block runs and yield the ``Recorder``."""
+    recorder = Recorder()
+    _recorders.append(recorder)
+    _refresh()
+    try:
+        yield recorder
+    finally:
+        _recorders.remove(recorder)
+        _refresh()
+
+
+def add_hook(callback: Hook) -> Callable[[], None]:
+    """Call ``callback(stage, seconds, shots)`` after every stage; returns a remover."""
+    _hooks.append(callback)
+    _refresh()
+
+    def remove() -> None:
+        remove_hook(callback)
+
+    return remove
+
+
+def remove_hook(callback: Hook) -> None:
+    if callback in _hooks:
+        _hooks.remove(callback)
+    _refresh()
@@ -0,0 +1,104 @@
+"""Vectorized local hidden-variable (LHV) baselines."""
+
+from __future__ import annotations
+
+from typing import Callable, Sequence, Tuple
+
+import numpy as np
+
+from .chsh import CorrelationResult
+from .measure import OutcomeCounts
+from .simulate import _draw_settings
+
+# A strategy maps (shots, rng) to an int8 (shots, 4) matrix of pre-assigned ±1
+# answers for the settings (a, a', b, b').
+Strategy = Callable[[int, np.random.Generator], np.ndarray]
+
+# Columns of the hidden-variable matrix read by Alice and Bob for each setting
+# (a,b), (a,b'), (a',b), (a',b').
+_ALICE_COLUMN = np.array([0, 0, 1, 1])
+_BOB_COLUMN = np.array([2, 3, 2, 3])
+
+
+def random_strategy(shots: int, rng: np.random.Generator) -> np.ndarray:
+    """Independent fair ±1 answers for every setting (S = 0 on average)."""
+    return (2 * rng.integers(0, 2, size=(shots, 4), dtype=np.int8) - 1).astype(np.int8)
+
+
+def deterministic_strategy(assignment: Sequence[int]) -> Strategy:
+    """Always answer with the same ±1 values for (a, a', b, b')."""
+    row = np.asarray(assignment, dtype=np.int8)
+    if row.shape != (4,) or not np.all(np.abs(row) == 1):
+        raise ValueError("assignment must hold four ±1 values for (a, a', b, b').")
+
+    def strategy(shots: int, rng: np.random.Generator) -> np.ndarray:
+        return np.broadcast_to(row, (shots, 4))
+
+    return strategy
+
+
+def mixed_strategy(
+    assignments: Sequence[Sequence[int]],
+    weights: Sequence[float] | None = None,
+) -> Strategy:
+    """Draw one deterministic assignment per shot with the given weights."""
+    rows = np.asarray(assignments, dtype=np.int8)
+    if rows.ndim != 2 or rows.shape[1] != 4 or not np.all(np.abs(rows) == 1):
+        raise ValueError("assignments must be an (n, 4) array of ±1 values.")
+    probs = None if weights is None else np.asarray(weights, dtype=float) / np.sum(weights)
+
+    def strategy(shots: int, rng: np.random.Generator) -> np.ndarray:
+        return rows[rng.choice(len(rows), size=shots, p=probs)]
+
+    return strategy
+
+
+optimal_strategy: Strategy = deterministic_strategy((+1, +1, +1, +1))
+"""Deterministic strategy saturating the local bound: E = (1, 1, 1, 1), S = 2."""
+
+
+def lhv_counts(
+    strategy: Strategy = random_strategy,
+    *,
+    shots: int,
+    schedule: str = "cycle",
+    rng: np.random.Generator | None = None,
+    chunk_size: int = 1_000_000,
+) -> Tuple[OutcomeCounts, ...]:
+    """Run ``shots`` LHV trials and return per-setting joint counts.
+
+    Settings follow the same ``schedule`` as ``chsh_stream``; hidden assignments
+    are drawn ``chunk_size`` rows at a time so memory stays bounded.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1.")
+    counts = np.zeros(16, dtype=np.int64)
+    done = 0
+    while done < shots:
+        size = min(chunk_size, shots - done)
+        hidden = strategy(size, rng)
+        settings = _draw_settings(done, size, 4, schedule, rng)
+        rows = np.arange(size)
+        alice_minus = hidden[rows, _ALICE_COLUMN[settings]] < 0
+        bob_minus = hidden[rows, _BOB_COLUMN[settings]] < 0
+        index = settings * 4 + 2 * alice_minus + bob_minus
+        counts += np.bincount(index, minlength=16)
+        done += size
+    return tuple(OutcomeCounts.from_array(row) for row in counts.reshape(4, 4))
+
+
+def lhv_chsh_value(
+    strategy: Strategy = random_strategy,
+    *,
+    shots: int,
+    schedule: str = "cycle",
+    rng: np.random.Generator | None = None,
+    chunk_size: int = 1_000_000,
+) -> CorrelationResult:
+    """CHSH S for an LHV strategy over ``shots`` trials (never above 2 in expectation)."""
+    counts = lhv_counts(strategy, shots=shots, schedule=schedule, rng=rng, chunk_size=chunk_size)
+    e_vals = [c.correlation for c in counts]
+    value = e_vals[0] + e_vals[1] + e_vals[2] - e_vals[3]
+    return CorrelationResult(value=float(value), shots=shots, counts=counts)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Tuple
 
 import numpy as np
 
@@ -11,33 +13,251 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     qutip = None
 
-from .states import as_density_matrix
+from .instrument import stage
+from .states import BellLabel, State, as_density_matrix, werner_structure
 
 Outcome = Tuple[int, int]
+Angles = Tuple[Tuple[float, float], Tuple[float, float]]
+
+
+OPERATOR_CACHE_SIZE = 256
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+@lru_cache(maxsize=OPERATOR_CACHE_SIZE)
+def _projector_pair(theta: float) -> Tuple[np.ndarray, np.ndarray]:
+    with stage("measure.projector"):
+        half = theta / 2.0
+        v_plus = np.array([np.cos(half), np.sin(half)], dtype=np.complex128)
+        v_minus = np.array([-np.sin(half), np.cos(half)], dtype=np.complex128)
+        p_plus = np.outer(v_plus, v_plus.conj())
+        p_minus = np.outer(v_minus, v_minus.conj())
+    return _read_only(p_plus), _read_only(p_minus)
+
+
+@lru_cache(maxsize=OPERATOR_CACHE_SIZE)
+def _observable(theta: float) -> np.ndarray:
+    p_plus, p_minus = _projector_pair(theta)
+    return _read_only(p_plus - p_minus)
+
+
+@lru_cache(maxsize=OPERATOR_CACHE_SIZE)
+def _joint_projectors(theta_a: float, theta_b: float) -> np.ndarray:
+    p_a_plus, p_a_minus = _projector_pair(theta_a)
+    p_b_plus, p_b_minus = _projector_pair(theta_b)
+    with stage("measure.kron"):
+        ops = np.stack(
+            [
+                np.kron(p_a_plus, p_b_plus),
+                np.kron(p_a_plus, p_b_minus),
+                np.kron(p_a_minus, p_b_plus),
+                np.kron(p_a_minus, p_b_minus),
+            ]
+        )
+    return _read_only(ops)
 
 
 def projector(theta: float) -> Tuple[np.ndarray, np.ndarray]:
-    """Return projectors onto ±1 eigenstates for σ·n in the x–z plane."""
-    half = theta / 2.0
-    v_plus = np.array([np.cos(half), np.sin(half)], dtype=np.complex128)
-    v_minus = np.array([-np.sin(half), np.cos(half)], dtype=np.complex128)
-    p_plus = np.outer(v_plus, v_plus.conj())
-    p_minus = np.outer(v_minus, v_minus.conj())
-    return p_plus, p_minus
+    """Return projectors onto ±1 eigenstates for σ·n in the x–z plane.
+
+    The arrays are cached per angle and read-only; copy them before mutating.
+    """
+    return _projector_pair(float(theta))
 
 
 def observable(theta: float) -> np.ndarray:
     """Return the ±1-valued observable associated with projector(theta)."""
-    p_plus, p_minus = projector(theta)
-    return p_plus - p_minus
+    return _observable(float(theta))
+
+
+def joint_projectors(theta_a: float, theta_b: float) -> np.ndarray:
+    """Return the cached, read-only 4x4 joint POVM elements stacked as ``OUTCOMES``."""
+    return _joint_projectors(float(theta_a), float(theta_b))
+
+
+def operator_cache_info() -> Dict[str, object]:
+    """Hit/miss statistics for the projector, observable and joint-operator caches."""
+    return {
+        "projector": _projector_pair.cache_info(),
+        "observable": _observable.cache_info(),
+        "joint": _joint_projectors.cache_info(),
+    }
+
+
+def clear_operator_cache() -> None:
+    """Drop all cached measurement operators and reset their counters."""
+    _projector_pair.cache_clear()
+    _observable.cache_clear()
+    _joint_projectors.cache_clear()
 
 
 def _to_density(state) -> np.ndarray:
+    if isinstance(state, State):
+        return state.rho
     if qutip is not None and isinstance(state, qutip.Qobj):  # pragma: no cover - optional dependency
         return as_density_matrix(np.asarray(state.full(), dtype=np.complex128))
     return as_density_matrix(state)
 
 
+OUTCOMES: Tuple[Outcome, ...] = ((+1, +1), (+1, -1), (-1, +1), (-1, -1))
+
+
+# For Werner states E(a, b) = sign * v * cos(a + twist * b) under projector()'s convention.
+_WERNER_CORRELATION = {
+    "Phi+": (+1.0, -1.0),
+    "Phi-": (+1.0, +1.0),
+    "Psi+": (-1.0, +1.0),
+    "Psi-": (-1.0, -1.0),
+}
+
+
+def werner_correlation(label: BellLabel, visibility: float, theta_a, theta_b):
+    """Closed-form E(theta_a, theta_b) for a Werner state; broadcasts over angles."""
+    sign, twist = _WERNER_CORRELATION[label]
+    return sign * visibility * np.cos(np.add(theta_a, np.multiply(twist, theta_b)))
+
+
+def joint_probabilities(state, theta_a: float, theta_b: float) -> np.ndarray:
+    """Born probabilities for the joint outcomes, ordered as ``OUTCOMES``.
+
+    Werner and Bell states take a closed-form path (both marginals are uniform, so
+    P(a, b) = (1 + a b E) / 4); other states use the cached joint projectors.
+    """
+    rho = _to_density(state)
+    with stage("measure.born"):
+        structure = state.structure if isinstance(state, State) else werner_structure(rho)
+        if structure is not None:
+            e_val = float(werner_correlation(structure[0], structure[1], theta_a, theta_b))
+            agree = 0.25 * (1.0 + e_val)
+            disagree = 0.25 * (1.0 - e_val)
+            return np.array([agree, disagree, disagree, agree])
+        ops = joint_projectors(theta_a, theta_b)
+        probs = np.real(np.einsum("kij,ji->k", ops, rho))
+        probs = np.clip(probs, 0.0, 1.0)
+        probs /= probs.sum()
+    return probs
+
+
+def sample_outcomes(
+    state,
+    theta_a: float,
+    theta_b: float,
+    shots: int,
+    rng: np.random.Generator | None = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Draw ``shots`` joint outcomes at once and return Alice's and Bob's ±1 arrays."""
+    if shots < 0:
+        raise ValueError("shots must be non-negative.")
+    if rng is None:
+        rng = np.random.default_rng()
+    index = sample_indices(joint_probabilities(state, theta_a, theta_b), shots, rng)
+    table = np.array(OUTCOMES, dtype=np.int8)
+    return table[index, 0], table[index, 1]
+
+
+def sample_indices(probs: np.ndarray, shots: int, rng: np.random.Generator) -> np.ndarray:
+    """Draw ``shots`` outcome indices from ``probs`` by inverse-CDF lookup."""
+    cdf = np.cumsum(probs)
+    cdf[-1] = 1.0
+    with stage("measure.rng", shots):
+        return np.searchsorted(cdf, rng.random(shots), side="right")
+
+
+@dataclass(frozen=True)
+class OutcomeCounts:
+    """Joint outcome counts for one setting pair, ordered as ``OUTCOMES``."""
+
+    plus_plus: int
+    plus_minus: int
+    minus_plus: int
+    minus_minus: int
+
+    @classmethod
+    def from_array(cls, counts) -> "OutcomeCounts":
+        n_pp, n_pm, n_mp, n_mm = (int(c) for c in counts)
+        return cls(n_pp, n_pm, n_mp, n_mm)
+
+    def as_array(self) -> np.ndarray:
+        return np.array(
+            [self.plus_plus, self.plus_minus, self.minus_plus, self.minus_minus],
+            dtype=np.int64,
+        )
+
+    def __add__(self, other: "OutcomeCounts") -> "OutcomeCounts":
+        if not isinstance(other, OutcomeCounts):
+            return NotImplemented
+        return OutcomeCounts.from_array(self.as_array() + other.as_array())
+
+    @property
+    def shots(self) -> int:
+        return self.plus_plus + self.plus_minus + self.minus_plus + self.minus_minus
+
+    @property
+    def correlation(self) -> float:
+        """Estimate of E = ⟨A B⟩."""
+        if self.shots == 0:
+            return float("nan")
+        agree = self.plus_plus + self.minus_minus
+        disagree = self.plus_minus + self.minus_plus
+        return (agree - disagree) / self.shots
+
+    @property
+    def alice_plus(self) -> float:
+        """Estimate of P(A = +1)."""
+        if self.shots == 0:
+            return float("nan")
+        return (self.plus_plus + self.plus_minus) / self.shots
+
+    @property
+    def bob_plus(self) -> float:
+        """Estimate of P(B = +1)."""
+        if self.shots == 0:
+            return float("nan")
+        return (self.plus_plus + self.minus_plus) / self.shots
+
+    @property
+    def correlation_stderr(self) -> float:
+        if self.shots == 0:
+            return float("nan")
+        return float(np.sqrt(max(0.0, 1.0 - self.correlation**2) / self.shots))
+
+    @property
+    def alice_stderr(self) -> float:
+        if self.shots == 0:
+            return float("nan")
+        p = self.alice_plus
+        return float(np.sqrt(p * (1.0 - p) / self.shots))
+
+    @property
+    def bob_stderr(self) -> float:
+        if self.shots == 0:
+            return float("nan")
+        p = self.bob_plus
+        return float(np.sqrt(p * (1.0 - p) / self.shots))
+
+
+def sample_counts(
+    state,
+    theta_a: float,
+    theta_b: float,
+    shots: int,
+    rng: np.random.Generator | None = None,
+) -> OutcomeCounts:
+    """Draw ``shots`` joint outcomes as a single multinomial and return only the counts."""
+    if shots < 0:
+        raise ValueError("shots must be non-negative.")
+    if rng is None:
+        rng = np.random.default_rng()
+    probs = joint_probabilities(state, theta_a, theta_b)
+    with stage("measure.rng", shots):
+        draws = rng.multinomial(shots, probs)
+    return OutcomeCounts.from_array(draws)
+
+
 def sample_outcome(
     state,
     theta_a: float,
@@ -47,18 +267,7 @@ def sample_outcome(
     """Draw a joint outcome (+/-1, +/-1) using the Born rule."""
     if rng is None:
         rng = np.random.default_rng()
-    rho = _to_density(state)
-    p_a_plus, p_a_minus = projector(theta_a)
-    p_b_plus, p_b_minus = projector(theta_b)
-    ops = {
-        (+1, +1): np.kron(p_a_plus, p_b_plus),
-        (+1, -1): np.kron(p_a_plus, p_b_minus),
-        (-1, +1): np.kron(p_a_minus, p_b_plus),
-        (-1, -1): np.kron(p_a_minus, p_b_minus),
-    }
-    probs = np.array([np.real(np.trace(op @ rho)) for op in ops.values()], dtype=float)
-    probs = np.clip(probs, 0.0, 1.0)
-    probs /= probs.sum()
-    outcomes = list(ops.keys())
-    choice = rng.choice(len(outcomes), p=probs)
-    return outcomes[choice]
+    probs = joint_probabilities(state, theta_a, theta_b)
+    with stage("measure.rng", 1):
+        choice = rng.choice(len(OUTCOMES), p=probs)
+    return OUTCOMES[choice]
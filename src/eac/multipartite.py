@@ -0,0 +1,276 @@
+"""Multi-party (GHZ/Mermin) and qudit (CGLMP) constraint tests.
+
+Local measurement probabilities are computed by rotating one tensor axis at a
+time (O(N 2^N) for N qubits), never by building 2^N x 2^N Kronecker operators.
+Qubit outcome index bit ``k`` (most significant first) is 0 for +1 and 1 for -1
+on party ``k``, matching the ``OUTCOMES`` ordering of the two-qubit code.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .chsh import CorrelationResult, LinearResult
+from .measure import sample_indices
+
+# Bloch direction (theta, phi) of the Pauli measurements used by Mermin tests.
+PAULI_DIRECTIONS = {"x": (np.pi / 2, 0.0), "y": (np.pi / 2, np.pi / 2), "z": (0.0, 0.0)}
+
+
+def ghz_state(n_qubits: int) -> np.ndarray:
+    """Return the N-qubit GHZ vector (|0...0⟩ + |1...1⟩)/√2."""
+    if n_qubits < 2:
+        raise ValueError("GHZ states need at least two qubits.")
+    vec = np.zeros(2**n_qubits, dtype=np.complex128)
+    vec[0] = vec[-1] = 1.0 / np.sqrt(2.0)
+    return vec
+
+
+def measurement_basis(theta: float, phi: float = 0.0) -> np.ndarray:
+    """Rows are ⟨+n| and ⟨-n| for the Bloch direction (theta, phi).
+
+    With ``phi = 0`` this is the x–z plane convention of ``eac.measure.projector``.
+    """
+    half = theta / 2.0
+    phase = np.exp(1j * phi)
+    v_plus = np.array([np.cos(half), phase * np.sin(half)], dtype=np.complex128)
+    v_minus = np.array([-np.conj(phase) * np.sin(half), np.cos(half)], dtype=np.complex128)
+    return np.stack([v_plus.conj(), v_minus.conj()])
+
+
+def _rotate_axes(tensor: np.ndarray, bases: Sequence[np.ndarray], offset: int = 0) -> np.ndarray:
+    for k, basis in enumerate(bases):
+        tensor = np.moveaxis(np.tensordot(basis, tensor, axes=([1], [k + offset])), 0, k + offset)
+    return tensor
+
+
+def local_probabilities(
+    state, thetas: Sequence[float], phis: Sequence[float] | None = None
+) -> np.ndarray:
+    """Joint outcome probabilities for local qubit measurements on every party.
+
+    ``state`` is an N-qubit vector (any N) or density matrix (small N). Returns a
+    length-2^N array indexed by the outcome bits.
+    """
+    n = len(thetas)
+    phis = [0.0] * n if phis is None else list(phis)
+    bases = [measurement_basis(theta, phi) for theta, phi in zip(thetas, phis)]
+    state = np.asarray(state, dtype=np.complex128)
+    if state.ndim == 1:
+        if state.shape[0] != 2**n:
+            raise ValueError("State dimension does not match the number of settings.")
+        amps = _rotate_axes(state.reshape((2,) * n), bases)
+        probs = np.abs(amps.reshape(-1)) ** 2
+    else:
+        if state.shape != (2**n, 2**n):
+            raise ValueError("State dimension does not match the number of settings.")
+        rho = _rotate_axes(state.reshape((2,) * (2 * n)), bases)
+        rho = _rotate_axes(rho, [basis.conj() for basis in bases], offset=n)
+        probs = np.real(np.diagonal(rho.reshape(2**n, 2**n)))
+    probs = np.clip(probs, 0.0, None)
+    return probs / probs.sum()
+
+
+def _parity_signs(n: int) -> np.ndarray:
+    """(-1)^(number of -1 outcomes) for every outcome index."""
+    index = np.arange(2**n, dtype=np.int64)
+    parity = np.zeros_like(index)
+    for k in range(n):
+        parity ^= (index >> k) & 1
+    return 1 - 2 * parity
+
+
+def sample_local_outcomes(
+    state,
+    thetas: Sequence[float],
+    phis: Sequence[float] | None = None,
+    *,
+    shots: int,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """Draw ``shots`` joint outcomes as an int8 (shots, N) array of ±1."""
+    if rng is None:
+        rng = np.random.default_rng()
+    n = len(thetas)
+    index = sample_indices(local_probabilities(state, thetas, phis), shots, rng)
+    bits = (index[:, None] >> np.arange(n - 1, -1, -1)) & 1
+    return (1 - 2 * bits).astype(np.int8)
+
+
+def mermin_terms(n_qubits: int) -> List[Tuple[str, int]]:
+    """Terms of M_N = Re ∏_k (X_k + i Y_k): settings string and ±1 coefficient."""
+    terms = []
+    for settings in itertools.product("xy", repeat=n_qubits):
+        n_y = settings.count("y")
+        if n_y % 2 == 0:
+            terms.append(("".join(settings), -1 if (n_y // 2) % 2 else 1))
+    return terms
+
+
+def mermin_local_bound(n_qubits: int) -> float:
+    """Largest M_N reachable by local hidden-variable models: 2^floor(N/2)."""
+    return float(2 ** (n_qubits // 2))
+
+
+def _n_qubits(state: np.ndarray, n_qubits: Optional[int]) -> int:
+    dim = state.shape[0]
+    n = dim.bit_length() - 1
+    if dim < 4 or dim != 2**n or state.shape not in ((dim,), (dim, dim)):
+        raise ValueError("State must be a vector or density matrix on N >= 2 qubits.")
+    if n_qubits is not None and n_qubits != n:
+        raise ValueError(f"State has {n} qubits, not {n_qubits}.")
+    return n
+
+
+def mermin_exact(state, n_qubits: Optional[int] = None) -> CorrelationResult:
+    """Exact M_N using ∏_k (X_k + i Y_k) = 2^N |0...0⟩⟨1...1|.
+
+    N is read from the state; a ``n_qubits`` that disagrees raises ``ValueError``.
+    GHZ states reach 2^(N-1) against the local bound 2^floor(N/2).
+    """
+    state = np.asarray(state, dtype=np.complex128)
+    n_qubits = _n_qubits(state, n_qubits)
+    if state.ndim == 1:
+        element = np.conj(state[0]) * state[-1]
+    else:
+        element = state[-1, 0]
+    return CorrelationResult(value=float(2**n_qubits * np.real(element)), shots=0)
+
+
+def mermin_value(
+    state,
+    n_qubits: Optional[int] = None,
+    *,
+    shots: int = 10_000,
+    terms: int | None = None,
+    rng: np.random.Generator | None = None,
+) -> CorrelationResult:
+    """Estimate M_N by sampling ``shots`` per Mermin term.
+
+    All 2^(N-1) terms are measured by default. With ``terms`` set, that many terms
+    are drawn uniformly at random and rescaled, which gives an unbiased estimate
+    for large N. The result carries each term's (even, odd) parity counts, which
+    is all the statistic depends on.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    state = np.asarray(state, dtype=np.complex128)
+    n_qubits = _n_qubits(state, n_qubits)
+    all_terms = mermin_terms(n_qubits)
+    chosen = all_terms
+    if terms is not None and terms < len(all_terms):
+        picks = rng.choice(len(all_terms), size=terms, replace=False)
+        chosen = [all_terms[i] for i in picks]
+    odd = _parity_signs(n_qubits) < 0
+    scale = len(all_terms) / len(chosen)
+    counts = np.zeros((len(chosen), 2), dtype=np.int64)
+    weights = np.zeros((len(chosen), 2))
+    for row, (settings, coefficient) in enumerate(chosen):
+        thetas, phis = zip(*(PAULI_DIRECTIONS[s] for s in settings))
+        probs = local_probabilities(state, thetas, phis)
+        n_odd = rng.binomial(shots, min(1.0, float(probs[odd].sum())))
+        counts[row] = (shots - n_odd, n_odd)
+        weights[row] = (coefficient * scale, -coefficient * scale)
+    value = float(np.sum(weights * counts) / shots)
+    return LinearResult(
+        value=value, shots=shots * len(chosen), case_counts=counts, weights=weights
+    )
+
+
+def max_entangled_qudits(dim: int) -> np.ndarray:
+    """Return Σ_j |j j⟩ / √d as a length-d² vector."""
+    vec = np.zeros(dim * dim, dtype=np.complex128)
+    vec[:: dim + 1] = 1.0 / np.sqrt(dim)
+    return vec
+
+
+def _cglmp_bases(dim: int) -> Tuple[np.ndarray, np.ndarray]:
+    """CGLMP measurement bases, shape (setting, outcome, level).
+
+    Phases are chosen so the maximally entangled state reaches the known optimum
+    (2.8284, 2.8729, 2.8962, ... for d = 2, 3, 4).
+    """
+    j = np.arange(dim)
+    k = np.arange(dim)[:, None]
+    alpha = np.array([0.0, 0.5])[:, None, None]
+    beta = np.array([-0.25, 0.25])[:, None, None]
+    alice = np.exp(2j * np.pi * j * (k + alpha) / dim) / np.sqrt(dim)
+    bob = np.exp(-2j * np.pi * j * (k + beta) / dim) / np.sqrt(dim)
+    return alice, bob
+
+
+def cglmp_probabilities(state, dim: int) -> np.ndarray:
+    """P[a, b, k, l] for Alice setting a, Bob setting b and outcomes k, l.
+
+    ``state`` is a pure two-qudit vector of length d² or a d² x d² density matrix.
+    """
+    alice, bob = _cglmp_bases(dim)
+    state = np.asarray(state, dtype=np.complex128)
+    if state.ndim == 1:
+        psi = state.reshape(dim, dim)
+        amps = np.einsum("akj,blm,jm->abkl", alice.conj(), bob.conj(), psi)
+        probs = np.abs(amps) ** 2
+    else:
+        rho = state.reshape(dim, dim, dim, dim)
+        probs = np.real(
+            np.einsum("akj,blm,jmpq,akp,blq->abkl", alice.conj(), bob.conj(), rho, alice, bob)
+        )
+    probs = np.clip(probs, 0.0, None)
+    return probs / probs.sum(axis=(-2, -1), keepdims=True)
+
+
+def cglmp_weights(dim: int) -> np.ndarray:
+    """W[a, b, k, l] with I_d = sum(W * P); I_d is linear in the probabilities.
+
+    Each term adds P(A = B + shift mod d) for one setting pair, or P(B = A + shift)
+    for the transposed (A', B) and (A, B') terms.
+    """
+    weights = np.zeros((2, 2, dim, dim))
+    level = np.arange(dim)
+
+    def add(a: int, b: int, shift: int, transpose: bool, coefficient: float) -> None:
+        rows, cols = (level + shift) % dim, level
+        if transpose:
+            rows, cols = cols, rows
+        weights[a, b, rows, cols] += coefficient
+
+    for k in range(dim // 2):
+        weight = 1.0 - 2.0 * k / (dim - 1)
+        for a, b, plus, minus, transpose in (
+            (0, 0, k, -k - 1, False),
+            (1, 0, k + 1, -k, True),
+            (1, 1, k, -k - 1, False),
+            (0, 1, k, -k - 1, True),
+        ):
+            add(a, b, plus, transpose, weight)
+            add(a, b, minus, transpose, -weight)
+    return weights
+
+
+def cglmp_statistic(probs: np.ndarray) -> float:
+    """CGLMP I_d from P[a, b, k, l]; local models obey I_d <= 2."""
+    return float(np.sum(cglmp_weights(probs.shape[-1]) * probs))
+
+
+def cglmp_exact(state, dim: int) -> CorrelationResult:
+    return CorrelationResult(value=cglmp_statistic(cglmp_probabilities(state, dim)), shots=0)
+
+
+def cglmp_value(
+    state,
+    dim: int,
+    *,
+    shots: int = 10_000,
+    rng: np.random.Generator | None = None,
+) -> CorrelationResult:
+    """Estimate I_d from ``shots`` multinomial draws per setting pair."""
+    if rng is None:
+        rng = np.random.default_rng()
+    probs = cglmp_probabilities(state, dim).reshape(4, dim * dim)
+    counts = rng.multinomial(shots, probs)
+    weights = cglmp_weights(dim).reshape(4, dim * dim)
+    value = float(np.sum(weights * counts) / shots)
+    return LinearResult(value=value, shots=4 * shots, case_counts=counts, weights=weights)
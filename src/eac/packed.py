@@ -0,0 +1,152 @@
+"""Compact outcome containers for very large shot arrays.
+
+Every shot is a 4-bit code ``setting * 4 + outcome`` (the same codes as
+``eac.shotlog``), where ``setting`` indexes (a,b), (a,b'), (a',b), (a',b') and
+``outcome`` indexes ``OUTCOMES``. ``PackedShots`` stores two codes per byte, so a
+10^9-shot experiment fits in 500 MB.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Tuple
+
+import numpy as np
+
+from .measure import OUTCOMES, OutcomeCounts
+
+N_SETTINGS = 4
+N_CODES = N_SETTINGS * len(OUTCOMES)
+
+
+def encode_shots(settings, alice, bob) -> np.ndarray:
+    """Pack setting indices and ±1 outcomes into one uint8 code per shot."""
+    settings = np.asarray(settings)
+    alice_minus = np.asarray(alice) < 0
+    bob_minus = np.asarray(bob) < 0
+    return (settings * len(OUTCOMES) + 2 * alice_minus + bob_minus).astype(np.uint8)
+
+
+def decode_shots(codes) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Inverse of ``encode_shots``: int8 settings, Alice and Bob outcome arrays."""
+    codes = np.asarray(codes, dtype=np.uint8)
+    settings = (codes >> 2).astype(np.int8)
+    alice = (1 - 2 * ((codes >> 1) & 1)).astype(np.int8)
+    bob = (1 - 2 * (codes & 1)).astype(np.int8)
+    return settings, alice, bob
+
+
+def table_correlations(table: np.ndarray) -> np.ndarray:
+    """Per-setting E from a (setting, outcome) count table."""
+    signs = np.array([a * b for a, b in OUTCOMES], dtype=float)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (table @ signs) / table.sum(axis=-1)
+
+
+def table_marginals(table: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-setting P(A = +1) and P(B = +1) from a (setting, outcome) count table."""
+    shots = table.sum(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        alice = (table[..., 0] + table[..., 1]) / shots
+        bob = (table[..., 0] + table[..., 2]) / shots
+    return alice, bob
+
+
+def pooled_marginals(table: np.ndarray, angles) -> dict:
+    """P(+1) per local angle from a (setting, outcome) table, pooled over remote settings.
+
+    Rows sharing a local angle are pooled, so with a == a' all four rows feed Alice's
+    single entry. Entries with no shots are None.
+    """
+    (a, a_prime), (b, b_prime) = angles
+    shots = table.sum(axis=-1)
+    alice_plus = table[:, 0] + table[:, 1]
+    bob_plus = table[:, 0] + table[:, 2]
+
+    def pooled(plus: np.ndarray, groups) -> dict:
+        rows_by_angle: dict = {}
+        for angle, rows in groups:
+            rows_by_angle.setdefault(float(angle), []).extend(rows)
+        ratios = {}
+        for angle, rows in rows_by_angle.items():
+            total = shots[rows].sum()
+            ratios[angle] = float(plus[rows].sum()) / float(total) if total else None
+        return ratios
+
+    return {
+        "alice": pooled(alice_plus, ((a, [0, 1]), (a_prime, [2, 3]))),
+        "bob": pooled(bob_plus, ((b, [0, 2]), (b_prime, [1, 3]))),
+    }
+
+
+class PackedShots:
+    """Nibble-packed shot codes: low nibble holds the even shot, high nibble the odd."""
+
+    __slots__ = ("data", "shots")
+
+    def __init__(self, data: np.ndarray, shots: int) -> None:
+        data = np.asarray(data, dtype=np.uint8)
+        if data.shape != ((shots + 1) // 2,):
+            raise ValueError("data must hold ceil(shots / 2) bytes.")
+        self.data = data
+        self.shots = int(shots)
+
+    @classmethod
+    def from_codes(cls, codes) -> "PackedShots":
+        codes = np.asarray(codes, dtype=np.uint8)
+        if codes.size and codes.max() >= N_CODES:
+            raise ValueError("Shot codes must lie in [0, 16).")
+        shots = codes.shape[0]
+        if shots % 2:
+            codes = np.append(codes, np.uint8(0))
+        data = codes[0::2] | (codes[1::2] << 4)
+        return cls(data.astype(np.uint8), shots)
+
+    @classmethod
+    def from_arrays(cls, settings, alice, bob) -> "PackedShots":
+        return cls.from_codes(encode_shots(settings, alice, bob))
+
+    @classmethod
+    def concatenate(cls, parts: Iterable["PackedShots"]) -> "PackedShots":
+        parts = list(parts)
+        if not parts:
+            return cls(np.zeros(0, dtype=np.uint8), 0)
+        if all(part.shots % 2 == 0 for part in parts[:-1]):
+            data = np.concatenate([part.data for part in parts])
+            return cls(data, sum(part.shots for part in parts))
+        return cls.from_codes(np.concatenate([part.codes() for part in parts]))
+
+    def __len__(self) -> int:
+        return self.shots
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.data.nbytes)
+
+    def codes(self) -> np.ndarray:
+        """Unpack to one uint8 code per shot."""
+        codes = np.empty(2 * self.data.shape[0], dtype=np.uint8)
+        codes[0::2] = self.data & 0x0F
+        codes[1::2] = self.data >> 4
+        return codes[: self.shots]
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Unpack to int8 settings, Alice and Bob outcome arrays."""
+        return decode_shots(self.codes())
+
+    def count_table(self) -> np.ndarray:
+        """(setting, outcome) counts from one byte histogram, without unpacking."""
+        hist = np.bincount(self.data, minlength=256).reshape(N_CODES, N_CODES)
+        # Row index is the high nibble, column index the low nibble.
+        counts = hist.sum(axis=0) + hist.sum(axis=1)
+        if self.shots % 2:
+            counts[0] -= 1  # padding nibble of the last byte
+        return counts.reshape(N_SETTINGS, len(OUTCOMES))
+
+    def setting_counts(self) -> Tuple[OutcomeCounts, ...]:
+        return tuple(OutcomeCounts.from_array(row) for row in self.count_table())
+
+    def correlations(self) -> np.ndarray:
+        return table_correlations(self.count_table())
+
+    def marginals(self) -> Tuple[np.ndarray, np.ndarray]:
+        return table_marginals(self.count_table())
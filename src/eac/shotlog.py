@@ -0,0 +1,177 @@
+"""Columnar on-disk shot logs with memory-mapped replay.
+
+A log file holds an 8-byte magic, a little-endian uint32 header length, a JSON
+header (angles, optional density matrix, seed) padded to a 64-byte boundary, and
+then one uint8 code per shot: ``setting * 4 + outcome``, where ``setting``
+indexes (a,b), (a,b'), (a',b), (a',b') and ``outcome`` indexes ``OUTCOMES``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from .measure import OUTCOMES, Angles, OutcomeCounts, _to_density
+from .packed import N_CODES, N_SETTINGS, PackedShots, encode_shots, pooled_marginals
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+MAGIC = b"EACSHOT1"
+_ALIGN = 64
+
+
+class ShotLogWriter:
+    """Append encoded shots to a log file; use as a context manager."""
+
+    def __init__(
+        self,
+        path: PathLike,
+        angles: Angles,
+        *,
+        state=None,
+        seed: Optional[int] = None,
+        schedule: Optional[str] = None,
+    ) -> None:
+        header = {
+            "version": 1,
+            "angles": [list(map(float, angles[0])), list(map(float, angles[1]))],
+            "seed": seed,
+            "schedule": schedule,
+            "state": None,
+        }
+        if state is not None:
+            rho = _to_density(state)
+            header["state"] = {"real": rho.real.tolist(), "imag": rho.imag.tolist()}
+        payload = json.dumps(header).encode("utf-8")
+        prefix = len(MAGIC) + 4 + len(payload)
+        payload += b" " * (-prefix % _ALIGN)
+        self.path = os.fspath(path)
+        self.shots = 0
+        self._handle = open(self.path, "wb")
+        self._handle.write(MAGIC + struct.pack("<I", len(payload)) + payload)
+
+    def write_codes(self, codes) -> None:
+        codes = np.ascontiguousarray(codes, dtype=np.uint8)
+        if codes.size and codes.max() >= N_CODES:
+            raise ValueError("Shot codes must lie in [0, 16).")
+        self._handle.write(codes.tobytes())
+        self.shots += int(codes.size)
+
+    def write(self, settings, alice, bob) -> None:
+        self.write_codes(encode_shots(settings, alice, bob))
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def __enter__(self) -> "ShotLogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ShotLog:
+    """Memory-mapped replay of a shot log; reductions run in bounded chunks."""
+
+    def __init__(self, path: PathLike, *, chunk_size: int = 1 << 24) -> None:
+        self.path = os.fspath(path)
+        self.chunk_size = chunk_size
+        with open(self.path, "rb") as handle:
+            magic = handle.read(len(MAGIC))
+            if magic != MAGIC:
+                raise ValueError(f"{self.path!r} is not a shot log.")
+            (length,) = struct.unpack("<I", handle.read(4))
+            header = json.loads(handle.read(length).decode("utf-8"))
+        offset = len(MAGIC) + 4 + length
+        self.header = header
+        (a, a_prime), (b, b_prime) = header["angles"]
+        self.angles: Angles = ((a, a_prime), (b, b_prime))
+        self.seed = header.get("seed")
+        self.schedule = header.get("schedule")
+        state = header.get("state")
+        self.state = (
+            None
+            if state is None
+            else np.asarray(state["real"]) + 1j * np.asarray(state["imag"])
+        )
+        size = os.path.getsize(self.path) - offset
+        self.codes = (
+            np.memmap(self.path, dtype=np.uint8, mode="r", offset=offset, shape=(size,))
+            if size
+            else np.zeros(0, dtype=np.uint8)
+        )
+        self._table: Optional[np.ndarray] = None
+
+    @property
+    def shots(self) -> int:
+        return int(self.codes.shape[0])
+
+    def __len__(self) -> int:
+        return self.shots
+
+    def count_table(self) -> np.ndarray:
+        """(setting, outcome) count table; the file is scanned once and the table kept."""
+        if self._table is None:
+            self._table = self._scan_counts()
+        return self._table.copy()
+
+    def _scan_counts(self) -> np.ndarray:
+        total = np.zeros(N_CODES, dtype=np.int64)
+        for start in range(0, self.shots, self.chunk_size):
+            chunk = self.codes[start : start + self.chunk_size]
+            total += np.bincount(chunk, minlength=N_CODES)
+        return total.reshape(N_SETTINGS, len(OUTCOMES))
+
+    def packed(self) -> PackedShots:
+        """Load the log into memory as nibble-packed shots, chunk by chunk."""
+        parts = [
+            PackedShots.from_codes(self.codes[start : start + self.chunk_size])
+            for start in range(0, self.shots, self.chunk_size)
+        ]
+        return PackedShots.concatenate(parts)
+
+    def setting_counts(self) -> Tuple[OutcomeCounts, ...]:
+        """Per-setting joint counts for (a,b), (a,b'), (a',b), (a',b')."""
+        return tuple(OutcomeCounts.from_array(row) for row in self.count_table())
+
+    def check_angles(self, angles: Angles) -> None:
+        """Raise ``ValueError`` unless ``angles`` are the ones the log was recorded with.
+
+        Rows are then read by position, which stays correct when a == a' or b == b'.
+        """
+        if not np.allclose(np.asarray(angles, dtype=float), np.asarray(self.angles, dtype=float)):
+            raise ValueError(f"Angles {angles} do not match those recorded in {self.path!r}.")
+
+    def setting_index(self, theta_a: float, theta_b: float) -> int:
+        """Index of the first recorded setting pair matching the given angles."""
+        return self._matching_rows(theta_a, theta_b)[0]
+
+    def pair_counts(self, theta_a: float, theta_b: float) -> OutcomeCounts:
+        """Joint counts for one angle pair, pooled over every row recorded with it."""
+        table = self.count_table()
+        return OutcomeCounts.from_array(table[self._matching_rows(theta_a, theta_b)].sum(axis=0))
+
+    def _matching_rows(self, theta_a: float, theta_b: float) -> list:
+        (a, a_prime), (b, b_prime) = self.angles
+        pairs = ((a, b), (a, b_prime), (a_prime, b), (a_prime, b_prime))
+        rows = [
+            index
+            for index, (pa, pb) in enumerate(pairs)
+            if np.isclose(pa, theta_a) and np.isclose(pb, theta_b)
+        ]
+        if not rows:
+            raise ValueError(
+                f"Setting ({theta_a}, {theta_b}) was not recorded in {self.path!r}."
+            )
+        return rows
+
+    def correlations(self) -> Tuple[float, ...]:
+        return tuple(c.correlation for c in self.setting_counts())
+
+    def marginals(self) -> dict:
+        """P(+1) for each local setting, pooled over the remote setting."""
+        return pooled_marginals(self.count_table(), self.angles)
@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
-from typing import Dict, Generator, Tuple
+from dataclasses import dataclass
+from typing import Dict, Generator, Optional, Tuple
 
 import numpy as np
 
-from .measure import sample_outcome
+from .instrument import stage
+from .measure import OUTCOMES, joint_probabilities, sample_outcome
 from .chsh import Angles
+from .packed import pooled_marginals
+from .shotlog import ShotLog, ShotLogWriter
+
+
+def _setting_pairs(angles: Angles) -> Tuple[Tuple[float, float], ...]:
+    (a, a_prime), (b, b_prime) = angles
+    return (
+        (a, b),
+        (a, b_prime),
+        (a_prime, b),
+        (a_prime, b_prime),
+    )
 
 
 def chsh_stream(
@@ -17,17 +31,23 @@ def chsh_stream(
     shots: int,
     schedule: str = "cycle",
     rng: np.random.Generator | None = None,
+    block_size: Optional[int] = None,
 ) -> Generator[dict, None, None]:
-    """Yield running statistics for CHSH experiments."""
+    """Yield running statistics for CHSH experiments.
+
+    By default one record is yielded per shot. With ``block_size`` the shots are
+    sampled in vectorized chunks and one record is yielded per block; ``settings``
+    and ``outcome`` then describe the last shot of the block.
+    """
     if rng is None:
         rng = np.random.default_rng()
+    if block_size is not None:
+        yield from _chsh_stream_blocks(
+            state, angles, shots=shots, schedule=schedule, rng=rng, block_size=block_size
+        )
+        return
     (a, a_prime), (b, b_prime) = angles
-    pairs: Tuple[Tuple[float, float], ...] = (
-        (a, b),
-        (a, b_prime),
-        (a_prime, b),
-        (a_prime, b_prime),
-    )
+    pairs = _setting_pairs(angles)
     corr_sums: Dict[Tuple[float, float], float] = {pair: 0.0 for pair in pairs}
     corr_counts: Dict[Tuple[float, float], int] = {pair: 0 for pair in pairs}
     alice_stats = {a: {"shots": 0, "plus": 0}, a_prime: {"shots": 0, "plus": 0}}
@@ -37,7 +57,8 @@ def chsh_stream(
             pair = pairs[int(rng.integers(len(pairs)))]
         else:
             pair = pairs[(shot - 1) % len(pairs)]
-        outcome = sample_outcome(state, pair[0], pair[1], rng=rng)
+        with stage("simulate.shot", 1):
+            outcome = sample_outcome(state, pair[0], pair[1], rng=rng)
         product = outcome[0] * outcome[1]
         corr_sums[pair] += product
         corr_counts[pair] += 1
@@ -70,3 +91,202 @@ def chsh_stream(
                 },
             },
         }
+
+
+def _draw_settings(
+    start: int, size: int, n_settings: int, schedule: str, rng: np.random.Generator
+) -> np.ndarray:
+    if schedule == "random":
+        return rng.integers(n_settings, size=size)
+    return np.arange(start, start + size) % n_settings
+
+
+def _draw_joint(table: np.ndarray, settings: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Sample one joint-outcome index per shot from the rows of ``table``."""
+    return _joint_index(table, settings, rng.random(settings.shape[0]))
+
+
+def _joint_index(table: np.ndarray, settings: np.ndarray, draws: np.ndarray) -> np.ndarray:
+    """Map uniform ``draws`` to joint-outcome indices through the rows of ``table``."""
+    cdf = np.cumsum(table, axis=1)
+    cdf[:, -1] = 1.0
+    index = (draws[:, None] >= cdf[settings]).sum(axis=1)
+    return np.minimum(index, table.shape[1] - 1)
+
+
+def _snapshot(
+    shot: int,
+    pairs: Tuple[Tuple[float, float], ...],
+    angles: Angles,
+    counts: np.ndarray,
+    last_setting: int,
+    last_outcome: int,
+) -> dict:
+    """Build a stream record from a (setting, outcome) count table."""
+    per_setting = counts.sum(axis=1)
+    signs = np.array([a_val * b_val for a_val, b_val in OUTCOMES], dtype=np.int64)
+    corr_sums = counts @ signs
+    with np.errstate(invalid="ignore", divide="ignore"):
+        e_vals = corr_sums / per_setting
+    running_s = None
+    if np.all(per_setting > 0):
+        running_s = float(e_vals[0] + e_vals[1] + e_vals[2] - e_vals[3])
+    return {
+        "shot": shot,
+        "settings": pairs[last_setting],
+        "outcome": OUTCOMES[last_outcome],
+        "running_s": running_s,
+        "correlations": {
+            str(pair): float(e_vals[i]) for i, pair in enumerate(pairs) if per_setting[i]
+        },
+        "marginals": pooled_marginals(counts, angles),
+    }
+
+
+def _chsh_stream_blocks(
+    state,
+    angles: Angles,
+    *,
+    shots: int,
+    schedule: str,
+    rng: np.random.Generator,
+    block_size: int,
+) -> Generator[dict, None, None]:
+    pairs = _setting_pairs(angles)
+    table = np.stack([joint_probabilities(state, pair[0], pair[1]) for pair in pairs])
+    yield from _stream_table(
+        table, angles, shots=shots, schedule=schedule, rng=rng, block_size=block_size
+    )
+
+
+def _count_blocks(
+    table: np.ndarray,
+    *,
+    shots: int,
+    schedule: str,
+    rng: np.random.Generator,
+    block_size: int,
+) -> Generator[Tuple[int, np.ndarray, np.ndarray, np.ndarray], None, None]:
+    """Yield (shots done, running count table, block settings, block outcomes)."""
+    if block_size < 1:
+        raise ValueError("block_size must be >= 1.")
+    n_settings, n_outcomes = table.shape
+    counts = np.zeros((n_settings, n_outcomes), dtype=np.int64)
+    done = 0
+    while done < shots:
+        size = min(block_size, shots - done)
+        with stage("simulate.block", size):
+            settings = _draw_settings(done, size, n_settings, schedule, rng)
+            outcomes = _draw_joint(table, settings, rng)
+            counts += np.bincount(
+                settings * n_outcomes + outcomes, minlength=n_settings * n_outcomes
+            ).reshape(n_settings, n_outcomes)
+        done += size
+        yield done, counts, settings, outcomes
+
+
+def _stream_table(
+    table: np.ndarray,
+    angles: Angles,
+    *,
+    shots: int,
+    schedule: str,
+    rng: np.random.Generator,
+    block_size: int,
+) -> Generator[dict, None, None]:
+    """Block-stream snapshots from a precomputed (setting, outcome) probability table."""
+    pairs = _setting_pairs(angles)
+    for done, counts, settings, outcomes in _count_blocks(
+        table, shots=shots, schedule=schedule, rng=rng, block_size=block_size
+    ):
+        yield _snapshot(done, pairs, angles, counts, int(settings[-1]), int(outcomes[-1]))
+
+
+@dataclass
+class SequentialResult:
+    decision: str
+    value: float
+    lower: float
+    upper: float
+    shots: int
+    confidence: float
+
+
+def chsh_sequential_test(
+    state,
+    angles: Angles,
+    *,
+    bound: float = 2.0,
+    confidence: float = 0.99,
+    max_shots: int = 1_000_000,
+    block_size: int = 1_000,
+    schedule: str = "cycle",
+    rng: np.random.Generator | None = None,
+) -> SequentialResult:
+    """Stream blocks of shots until S > ``bound`` or S <= ``bound`` is established.
+
+    After block k, each per-setting correlation gets a Hoeffding radius
+    sqrt(2 ln(8 / alpha_k) / n) with alpha_k = alpha / (k (k + 1)). The alpha_k sum
+    to alpha = 1 - ``confidence``, so the bounds on S hold simultaneously over every
+    look and stopping early is valid. ``decision`` is ``"violation"``,
+    ``"no_violation"`` or ``"inconclusive"`` when ``max_shots`` runs out first.
+    """
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("confidence must lie in (0, 1).")
+    if rng is None:
+        rng = np.random.default_rng()
+    alpha = 1.0 - confidence
+    pairs = _setting_pairs(angles)
+    table = np.stack([joint_probabilities(state, pair[0], pair[1]) for pair in pairs])
+    signs = np.array([a_val * b_val for a_val, b_val in OUTCOMES], dtype=float)
+    weights = np.array([1.0, 1.0, 1.0, -1.0])
+    value, lower, upper, done = float("nan"), -4.0, 4.0, 0
+    decision = "inconclusive"
+    blocks = _count_blocks(
+        table, shots=max_shots, schedule=schedule, rng=rng, block_size=block_size
+    )
+    for look, (done, counts, _, _) in enumerate(blocks, start=1):
+        per_setting = counts.sum(axis=1)
+        if np.any(per_setting == 0):
+            continue
+        e_vals = (counts @ signs) / per_setting
+        alpha_k = alpha / (look * (look + 1))
+        radius = float(np.sum(np.sqrt(2.0 * np.log(8.0 / alpha_k) / per_setting)))
+        value = float(weights @ e_vals)
+        lower, upper = value - radius, value + radius
+        if lower > bound:
+            decision = "violation"
+            break
+        if upper <= bound:
+            decision = "no_violation"
+            break
+    return SequentialResult(
+        decision=decision,
+        value=value,
+        lower=lower,
+        upper=upper,
+        shots=done,
+        confidence=confidence,
+    )
+
+
+def record_shot_log(
+    path,
+    state,
+    angles: Angles,
+    *,
+    shots: int,
+    schedule: str = "cycle",
+    seed: Optional[int] = None,
+    block_size: int = 1 << 20,
+) -> ShotLog:
+    """Simulate ``shots`` CHSH trials straight to a shot log and open it for replay."""
+    rng = np.random.default_rng(seed)
+    pairs = _setting_pairs(angles)
+    table = np.stack([joint_probabilities(state, pair[0], pair[1]) for pair in pairs])
+    with ShotLogWriter(path, angles, state=state, seed=seed, schedule=schedule) as writer:
+        for _, _, settings, outcomes in _count_blocks(
+            table, shots=shots, schedule=schedule, rng=rng, block_size=block_size
+        ):
+            writer.write_codes(settings * len(OUTCOMES) + outcomes)
+    return ShotLog(path)
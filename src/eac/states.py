@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Literal, Optional
+from functools import lru_cache
+from typing import Literal, Optional, Tuple
 
 import numpy as np
 
@@ -11,6 +12,8 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     qutip = None
 
+from .instrument import stage
+
 BellLabel = Literal["Phi+", "Phi-", "Psi+", "Psi-"]
 Backend = Literal["numpy", "qutip"]
 
@@ -38,14 +41,117 @@ def _bell_vector(label: BellLabel) -> np.ndarray:
 
 def as_density_matrix(state: np.ndarray) -> np.ndarray:
     """Convert a state vector or density matrix into a density matrix."""
-    state = np.asarray(state, dtype=np.complex128)
-    if state.ndim == 1:
-        return np.outer(state, state.conj())
-    if state.ndim == 2:
-        return state
+    if isinstance(state, State):
+        return state.rho
+    with stage("states.convert"):
+        state = np.asarray(state, dtype=np.complex128)
+        if state.ndim == 1:
+            return np.outer(state, state.conj())
+        if state.ndim == 2:
+            return state
     raise ValueError("State must be a vector or density matrix.")
 
 
+_STRUCTURE_ATOL = 1e-10
+# Werner families: coherence position (i, j) and its sign for each Bell label.
+_WERNER_COHERENCE = {
+    "Phi+": (0, 3, +1.0),
+    "Phi-": (0, 3, -1.0),
+    "Psi+": (1, 2, +1.0),
+    "Psi-": (1, 2, -1.0),
+}
+
+
+@lru_cache(maxsize=256)
+def _werner_structure_from_bytes(key: bytes) -> Optional[Tuple[BellLabel, float]]:
+    rho = np.frombuffer(key, dtype=np.complex128).reshape(4, 4)
+    for label, (i, j, sign) in _WERNER_COHERENCE.items():
+        visibility = 2.0 * sign * float(rho[i, j].real)
+        if visibility < -_STRUCTURE_ATOL or visibility > 1.0 + _STRUCTURE_ATOL:
+            continue
+        template = np.eye(4, dtype=np.complex128) * (1.0 - visibility) / 4.0
+        template[[i, j], [i, j]] += visibility / 2.0
+        template[i, j] = template[j, i] = sign * visibility / 2.0
+        if np.max(np.abs(rho - template)) <= _STRUCTURE_ATOL:
+            return label, min(max(visibility, 0.0), 1.0)
+    return None
+
+
+def werner_structure(state) -> Optional[Tuple[BellLabel, float]]:
+    """Return ``(label, v)`` if ``state`` is a Werner (or Bell) state, else ``None``.
+
+    Results are cached by the density-matrix bytes, so repeated calls on the same
+    state cost a hash lookup.
+    """
+    if isinstance(state, State):
+        return state.structure
+    rho = as_density_matrix(state)
+    if rho.shape != (4, 4):
+        return None
+    return _werner_structure_from_bytes(np.ascontiguousarray(rho).tobytes())
+
+
+class State:
+    """A density matrix converted and validated once, with cached structure flags.
+
+    Every ``eac`` routine accepts a ``State`` wherever it accepts an array and uses
+    the cached ``rho`` directly. ``rho`` is read-only.
+    """
+
+    __slots__ = ("rho", "purity", "is_pure", "structure")
+
+    def __init__(self, data, *, validate: bool = True, atol: float = 1e-9) -> None:
+        if isinstance(data, State):
+            data = data.rho
+        if qutip is not None and isinstance(data, qutip.Qobj):  # pragma: no cover - optional
+            data = data.full()
+        rho = np.array(as_density_matrix(data), dtype=np.complex128)
+        if validate:
+            with stage("states.validate"):
+                if rho.shape[0] != rho.shape[1]:
+                    raise ValueError("Density matrix must be square.")
+                if not np.allclose(rho, rho.conj().T, atol=atol):
+                    raise ValueError("Density matrix must be Hermitian.")
+                if abs(np.trace(rho).real - 1.0) > atol:
+                    raise ValueError("Density matrix must have unit trace.")
+                if np.linalg.eigvalsh(rho).min() < -atol:
+                    raise ValueError("Density matrix must be positive semidefinite.")
+        rho.setflags(write=False)
+        self.rho = rho
+        self.purity = float(np.real(np.vdot(rho, rho)))
+        self.is_pure = abs(self.purity - 1.0) <= atol
+        self.structure = werner_structure(rho)
+
+    @classmethod
+    def bell(cls, label: BellLabel = "Phi+") -> "State":
+        return cls(_bell_vector(label))
+
+    @classmethod
+    def werner(cls, visibility: float, *, singlet: BellLabel = "Phi+") -> "State":
+        return cls(werner_state(visibility, singlet=singlet))
+
+    @property
+    def kind(self) -> str:
+        """One of ``"bell"``, ``"werner"``, ``"pure"`` or ``"mixed"``."""
+        if self.structure is not None:
+            return "bell" if self.is_pure else "werner"
+        return "pure" if self.is_pure else "mixed"
+
+    def numpy(self) -> np.ndarray:
+        return self.rho
+
+    def qutip(self):
+        return _to_backend(np.array(self.rho), "qutip")
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self.rho if not copy else self.rho.copy()
+        return self.rho.astype(dtype)
+
+    def __repr__(self) -> str:
+        return f"State(kind={self.kind!r}, dim={self.rho.shape[0]}, purity={self.purity:.4f})"
+
+
 def _to_backend(array: np.ndarray, backend: Backend):
     if backend == "numpy":
         return array
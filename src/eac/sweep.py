@@ -0,0 +1,209 @@
+"""Vectorized Werner-state visibility sweeps."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+
+from .chsh import _PRODUCT_SIGNS, Angles
+from .measure import joint_probabilities
+from .simulate import _setting_pairs
+from .states import BellLabel, werner_state
+
+
+@dataclass
+class SweepResult:
+    visibilities: np.ndarray
+    values: np.ndarray
+    stderr: np.ndarray
+    ci_low: np.ndarray
+    ci_high: np.ndarray
+    exact: np.ndarray
+    counts: np.ndarray
+    shots: int
+
+
+def werner_probability_tables(
+    visibilities,
+    angles: Angles,
+    *,
+    singlet: BellLabel = "Phi+",
+) -> np.ndarray:
+    """Joint probability tables with shape (len(v), setting, outcome).
+
+    Werner probabilities are affine in v, so the pure-state table is built once and
+    mixed with the uniform 1/4 noise table for every visibility.
+    """
+    visibilities = np.asarray(visibilities, dtype=float)
+    if np.any((visibilities < 0.0) | (visibilities > 1.0)):
+        raise ValueError("visibility must lie in [0, 1].")
+    pure = werner_state(1.0, singlet=singlet)
+    pure_table = np.stack([joint_probabilities(pure, a, b) for a, b in _setting_pairs(angles)])
+    v = visibilities[..., None, None]
+    return v * pure_table + (1.0 - v) * 0.25
+
+
+def werner_sweep(
+    visibilities,
+    angles: Angles,
+    *,
+    shots: int = 20_000,
+    rng: np.random.Generator | None = None,
+    singlet: BellLabel = "Phi+",
+    confidence: float = 0.95,
+) -> SweepResult:
+    """Estimate S for every visibility with one vectorized multinomial pass.
+
+    ``shots`` is per setting, matching ``chsh_value``; the confidence interval is
+    the normal approximation built from the per-setting count standard errors.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    if shots < 1:
+        raise ValueError("shots must be >= 1.")
+    visibilities = np.asarray(visibilities, dtype=float)
+    tables = werner_probability_tables(visibilities, angles, singlet=singlet)
+    counts = rng.multinomial(shots, tables)
+    e_vals = counts @ _PRODUCT_SIGNS / shots
+    values = e_vals[..., 0] + e_vals[..., 1] + e_vals[..., 2] - e_vals[..., 3]
+    stderr = np.sqrt(np.sum(np.clip(1.0 - e_vals**2, 0.0, None), axis=-1) / shots)
+    exact_e = tables @ _PRODUCT_SIGNS
+    exact = exact_e[..., 0] + exact_e[..., 1] + exact_e[..., 2] - exact_e[..., 3]
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    return SweepResult(
+        visibilities=visibilities,
+        values=values,
+        stderr=stderr,
+        ci_low=values - z * stderr,
+        ci_high=values + z * stderr,
+        exact=exact,
+        counts=counts,
+        shots=shots,
+    )
+
+
+@dataclass
+class ThresholdResult:
+    visibility: float
+    lower: float
+    upper: float
+    total_shots: int
+    evaluations: int
+    resolved: bool
+
+
+def find_werner_threshold(
+    angles: Angles,
+    *,
+    tolerance: float = 0.01,
+    lower: float = 0.0,
+    upper: float = 1.0,
+    bound: float = 2.0,
+    batch_shots: int = 2_000,
+    max_shots_per_point: int = 500_000,
+    confidence: float = 0.99,
+    rng: np.random.Generator | None = None,
+    singlet: BellLabel = "Phi+",
+) -> ThresholdResult:
+    """Locate the visibility where S crosses ``bound`` by noisy bisection.
+
+    At each midpoint, counts are drawn in growing batches, starting at
+    ``batch_shots`` per setting. S is linear in v for Werner states, so each
+    interval on S(mid) maps through the slope dS/dv to an interval on the
+    crossing. Once that interval excludes the midpoint, the bracket shrinks to it,
+    which is at least a halving. ``tolerance`` is a half-width: the search stops
+    once the returned visibility is within ``tolerance`` of both bracket ends. Hitting ``max_shots_per_point`` first returns
+    the midpoint with ``resolved=False``. Shots therefore concentrate near the
+    crossing, where they are needed.
+
+    Every batch is a look at the data. Look k uses a normal interval at level
+    alpha_k = alpha / (k (k + 1)). These sum to alpha = 1 - ``confidence``, so the
+    returned bracket holds the crossing with at least that confidence.
+    S may increase or decrease with v. A ``ValueError`` is raised when S(lower)
+    and S(upper) do not straddle ``bound``.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    if not 0.0 <= lower < upper <= 1.0:
+        raise ValueError("Require 0 <= lower < upper <= 1.")
+    if tolerance <= 0.0:
+        raise ValueError("tolerance must be positive.")
+    end_tables = werner_probability_tables([lower, upper], angles, singlet=singlet)
+    end_e = end_tables @ _PRODUCT_SIGNS
+    end_s = end_e[:, 0] + end_e[:, 1] + end_e[:, 2] - end_e[:, 3]
+    if not min(end_s) < bound < max(end_s):
+        raise ValueError(
+            f"S runs from {end_s[0]:.4f} to {end_s[1]:.4f} over [lower, upper] "
+            f"and never crosses bound={bound}."
+        )
+    direction = 1.0 if end_s[1] > end_s[0] else -1.0
+    # S is linear in v for Werner states.
+    slope = abs(end_s[1] - end_s[0]) / (upper - lower)
+    alpha = 1.0 - confidence
+    normal = NormalDist()
+    look = 0
+    pooled_weight = 0.0
+    pooled_sum = 0.0
+    total_shots = 0
+    evaluations = 0
+    while upper - lower > 2.0 * tolerance:
+        mid = 0.5 * (lower + upper)
+        table = werner_probability_tables(mid, angles, singlet=singlet)
+        counts = np.zeros(table.shape, dtype=np.int64)
+        evaluations += 1
+        decided = False
+        while counts[0].sum() < max_shots_per_point:
+            # Growing batches keep the number of looks, and so the alpha spent, small.
+            batch = max(batch_shots, int(counts[0].sum()) // 4)
+            batch = min(batch, max_shots_per_point - int(counts[0].sum()))
+            counts += rng.multinomial(batch, table)
+            total_shots += 4 * batch
+            look += 1
+            z = normal.inv_cdf(1.0 - alpha / (2.0 * look * (look + 1)))
+            n = counts[0].sum()
+            e_vals = counts @ _PRODUCT_SIGNS / n
+            s_est = e_vals[0] + e_vals[1] + e_vals[2] - e_vals[3]
+            stderr = np.sqrt(np.sum(np.clip(1.0 - e_vals**2, 0.0, None)) / n)
+            # The estimate of S(mid) maps through the known slope to one of the crossing;
+            # earlier midpoints' estimates are pooled by inverse variance.
+            weight = (slope / max(stderr, 1e-12)) ** 2
+            estimate = mid + direction * (bound - s_est) / slope
+            centre = (pooled_sum + weight * estimate) / (pooled_weight + weight)
+            half_width = z / math.sqrt(pooled_weight + weight)
+            low = min(max(lower, centre - half_width), upper)
+            high = max(min(upper, centre + half_width), lower)
+            if high - low <= 2.0 * tolerance:
+                return ThresholdResult(
+                    visibility=min(max(centre, low), high),
+                    lower=low,
+                    upper=high,
+                    total_shots=total_shots,
+                    evaluations=evaluations,
+                    resolved=True,
+                )
+            if low > mid or high < mid:
+                lower, upper = low, high
+                pooled_weight += weight
+                pooled_sum += weight * estimate
+                decided = True
+                break
+        if not decided:
+            return ThresholdResult(
+                visibility=mid,
+                lower=lower,
+                upper=upper,
+                total_shots=total_shots,
+                evaluations=evaluations,
+                resolved=False,
+            )
+    return ThresholdResult(
+        visibility=0.5 * (lower + upper),
+        lower=lower,
+        upper=upper,
+        total_shots=total_shots,
+        evaluations=evaluations,
+        resolved=True,
+    )
@@ -0,0 +1,145 @@
+"""Analytic and bootstrap uncertainties for sampled CHSH (and other linear) results."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Literal, Union
+
+import numpy as np
+
+from .chsh import _PRODUCT_SIGNS, CorrelationResult, LinearResult
+from .parallel import ExecutorKind, Seed, _make_executor, _split_shots
+
+Statistic = Literal["correlation", "chsh", "no_signaling", "linear"]
+Sampled = Union[CorrelationResult, dict]
+
+
+@dataclass
+class BootstrapResult:
+    estimate: float
+    replicates: np.ndarray
+    stderr: float
+    ci_low: float
+    ci_high: float
+    confidence: float
+
+
+def _statistic_and_counts(result: Sampled):
+    if isinstance(result, LinearResult):
+        if result.weights is None or result.case_counts is None:
+            raise ValueError("Result carries no sampled counts (exact results have no error).")
+        return "linear", np.asarray(result.case_counts, dtype=np.int64), result.weights
+    if isinstance(result, CorrelationResult):
+        counts = result.counts
+        if len(counts) == 1:
+            kind: Statistic = "correlation"
+        elif len(counts) == 4:
+            kind = "chsh"
+        else:
+            raise ValueError("Result carries no sampled counts (exact results have no error).")
+    elif isinstance(result, dict) and "counts" in result:
+        counts = result["counts"]
+        kind = "no_signaling"
+    else:
+        raise TypeError("Expected a CorrelationResult or a check_no_signaling report.")
+    return kind, np.stack([c.as_array() for c in counts]), None
+
+
+def _evaluate(kind: Statistic, counts: np.ndarray, weights=None) -> np.ndarray:
+    """Evaluate the statistic on count arrays with shape (..., cases, outcomes)."""
+    shots = counts.sum(axis=-1)
+    if kind == "linear":
+        return np.sum(weights * counts / shots[..., None], axis=(-2, -1))
+    if kind == "no_signaling":
+        alice = (counts[..., 0] + counts[..., 1]) / shots
+        bob = (counts[..., 0] + counts[..., 2]) / shots
+        return np.maximum(
+            np.abs(alice[..., 0] - alice[..., 1]), np.abs(bob[..., 0] - bob[..., 2])
+        )
+    e_vals = (counts @ _PRODUCT_SIGNS) / shots
+    if kind == "correlation":
+        return e_vals[..., 0]
+    return e_vals[..., 0] + e_vals[..., 1] + e_vals[..., 2] - e_vals[..., 3]
+
+
+def standard_error(result: Sampled) -> float:
+    """Analytic (normal-approximation) standard error from the recorded counts.
+
+    For ``correlation`` and ``chsh_value`` results this is the error on E or S;
+    for a ``check_no_signaling`` report it is the larger of the errors on
+    Alice's and Bob's marginal differences. ``LinearResult`` values (Mermin,
+    CGLMP) use the variance of their weights under each case's frequencies.
+    """
+    kind, counts, weights = _statistic_and_counts(result)
+    shots = counts.sum(axis=-1).astype(float)
+    if kind == "linear":
+        probs = counts / shots[:, None]
+        mean = np.sum(probs * weights, axis=1)
+        variance = np.sum(probs * weights**2, axis=1) - mean**2
+        return float(np.sqrt(np.sum(np.clip(variance, 0.0, None) / shots)))
+    if kind == "no_signaling":
+        alice = (counts[:, 0] + counts[:, 1]) / shots
+        bob = (counts[:, 0] + counts[:, 2]) / shots
+        var_alice = alice[[0, 1]] * (1 - alice[[0, 1]]) / shots[[0, 1]]
+        var_bob = bob[[0, 2]] * (1 - bob[[0, 2]]) / shots[[0, 2]]
+        return float(np.sqrt(max(var_alice.sum(), var_bob.sum())))
+    e_vals = (counts @ _PRODUCT_SIGNS) / shots
+    return float(np.sqrt(np.sum(np.clip(1.0 - e_vals**2, 0.0, None) / shots)))
+
+
+def _replicate(
+    kind: Statistic,
+    counts: np.ndarray,
+    weights,
+    replicates: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    shots = counts.sum(axis=-1)
+    probs = counts / shots[:, None]
+    draws = np.stack(
+        [rng.multinomial(n, p, size=replicates) for n, p in zip(shots, probs)], axis=1
+    )
+    return _evaluate(kind, draws, weights)
+
+
+def bootstrap(
+    result: Sampled,
+    *,
+    replicates: int = 2_000,
+    confidence: float = 0.95,
+    seed: Seed = None,
+    workers: int = 1,
+    executor: ExecutorKind = "process",
+) -> BootstrapResult:
+    """Parametric bootstrap of E, S, a ``LinearResult`` or the no-signaling deviation.
+
+    Each replicate redraws every case's counts as one multinomial with the
+    observed frequencies, so thousands of replicates are a single batched call.
+    With ``workers > 1`` the replicates are split across a pool, with one
+    ``SeedSequence`` child per worker as in ``eac.parallel``.
+    """
+    if replicates < 2:
+        raise ValueError("replicates must be >= 2.")
+    kind, counts, weights = _statistic_and_counts(result)
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    if workers <= 1:
+        values = _replicate(kind, counts, weights, replicates, root)
+    else:
+        chunks = _split_shots(replicates, workers)
+        with _make_executor(executor, workers) as pool:
+            futures = [
+                pool.submit(_replicate, kind, counts, weights, chunk, child)
+                for chunk, child in zip(chunks, root.spawn(workers))
+            ]
+            values = np.concatenate([future.result() for future in futures])
+    tail = 50.0 * (1.0 - confidence)
+    low, high = np.percentile(values, [tail, 100.0 - tail])
+    return BootstrapResult(
+        estimate=float(_evaluate(kind, counts, weights)),
+        replicates=values,
+        stderr=float(np.std(values, ddof=1)),
+        ci_low=float(low),
+        ci_high=float(high),
+        confidence=confidence,
+    )
@@ -0,0 +1,151 @@
+"""Windowed and exponentially decaying CHSH estimators for drifting sources.
+
+Both estimators consume shot codes ``setting * 4 + outcome`` (as in
+``eac.packed``) and keep a (setting, outcome) table, so every update costs O(1)
+per shot and reading the estimates costs O(1) regardless of run length.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Callable, Generator, Optional
+
+import numpy as np
+
+from .chsh import Angles
+from .measure import werner_correlation
+from .packed import N_CODES, N_SETTINGS, pooled_marginals, table_correlations
+from .simulate import _draw_settings, _setting_pairs
+from .states import BellLabel
+
+
+class _TableEstimator:
+    def __init__(self, angles: Angles) -> None:
+        self.angles = angles
+        self.pairs = _setting_pairs(angles)
+
+    @property
+    def table(self) -> np.ndarray:
+        return self._table.reshape(N_SETTINGS, -1)
+
+    @property
+    def shots(self) -> float:
+        """Shots (or total weight, when decaying) behind the current estimates."""
+        return float(self._table.sum())
+
+    def correlations(self) -> np.ndarray:
+        return table_correlations(self.table)
+
+    def chsh(self) -> Optional[float]:
+        """S over the current window, or None until every setting has data."""
+        if np.any(self.table.sum(axis=1) == 0):
+            return None
+        e_vals = self.correlations()
+        return float(e_vals[0] + e_vals[1] + e_vals[2] - e_vals[3])
+
+    def marginals(self) -> dict:
+        """P(+1) per local angle, pooled over the remote party's two settings."""
+        return pooled_marginals(self.table, self.angles)
+
+    def snapshot(self) -> dict:
+        per_setting = self.table.sum(axis=1)
+        e_vals = self.correlations()
+        return {
+            "shots": self.shots,
+            "running_s": self.chsh(),
+            "correlations": {
+                str(pair): float(e_vals[i]) for i, pair in enumerate(self.pairs) if per_setting[i]
+            },
+            "marginals": self.marginals(),
+        }
+
+
+class WindowedCHSH(_TableEstimator):
+    """Estimates over exactly the last ``window`` shots, kept in a uint8 ring buffer."""
+
+    def __init__(self, angles: Angles, window: int) -> None:
+        if window < 1:
+            raise ValueError("window must be >= 1.")
+        super().__init__(angles)
+        self.window = int(window)
+        self._ring = np.zeros(self.window, dtype=np.uint8)
+        self._pos = 0
+        self._filled = 0
+        self._table = np.zeros(N_CODES, dtype=np.int64)
+
+    def update(self, codes) -> None:
+        """Append a block of shot codes, evicting the oldest beyond the window."""
+        codes = np.asarray(codes, dtype=np.uint8).ravel()
+        size = codes.shape[0]
+        if size >= self.window:
+            self._ring[:] = codes[-self.window:]
+            self._pos = 0
+            self._filled = self.window
+            self._table = np.bincount(self._ring, minlength=N_CODES).astype(np.int64)
+            return
+        slots = (self._pos + np.arange(size)) % self.window
+        # Slots past ``_filled`` are still empty and come first in ``slots``.
+        evicted = self._ring[slots[self.window - self._filled:]]
+        self._table -= np.bincount(evicted, minlength=N_CODES)
+        self._table += np.bincount(codes, minlength=N_CODES)
+        self._ring[slots] = codes
+        self._pos = (self._pos + size) % self.window
+        self._filled = min(self.window, self._filled + size)
+
+
+class DecayingCHSH(_TableEstimator):
+    """Exponentially weighted estimates; a shot's weight halves every ``half_life`` shots."""
+
+    def __init__(self, angles: Angles, half_life: float) -> None:
+        if half_life <= 0:
+            raise ValueError("half_life must be positive.")
+        super().__init__(angles)
+        self.half_life = float(half_life)
+        self._log_decay = -math.log(2.0) / self.half_life
+        self._table = np.zeros(N_CODES, dtype=float)
+
+    def update(self, codes) -> None:
+        """Decay the table by the block length and add the block with per-shot weights."""
+        codes = np.asarray(codes, dtype=np.uint8).ravel()
+        size = codes.shape[0]
+        weights = np.exp(self._log_decay * np.arange(size - 1, -1, -1, dtype=float))
+        self._table *= math.exp(self._log_decay * size)
+        self._table += np.bincount(codes, weights=weights, minlength=N_CODES)
+
+
+def drifting_werner_codes(
+    visibility: Callable[[np.ndarray], np.ndarray],
+    angles: Angles,
+    *,
+    shots: int,
+    block_size: int = 100_000,
+    schedule: str = "cycle",
+    singlet: BellLabel = "Phi+",
+    rng: np.random.Generator | None = None,
+) -> Generator[np.ndarray, None, None]:
+    """Yield blocks of shot codes from a Werner source with visibility ``v(t)``.
+
+    ``visibility`` receives the integer shot indices of a block and returns the
+    visibility of each shot (a scalar is broadcast). Every shot is drawn from
+    ``werner_state(v(t), singlet=singlet)`` through its closed form.
+    """
+    if block_size < 1:
+        raise ValueError("block_size must be >= 1.")
+    if rng is None:
+        rng = np.random.default_rng()
+    pairs = _setting_pairs(angles)
+    base = np.array([werner_correlation(singlet, 1.0, ta, tb) for ta, tb in pairs])
+    done = 0
+    while done < shots:
+        size = min(block_size, shots - done)
+        t = np.arange(done, done + size)
+        v = np.broadcast_to(np.asarray(visibility(t), dtype=float), (size,))
+        if np.any(v < 0.0) or np.any(v > 1.0):
+            raise ValueError("visibility must stay within [0, 1].")
+        settings = _draw_settings(done, size, N_SETTINGS, schedule, rng)
+        draws = rng.random((2, size))
+        disagree = draws[0] >= 0.5 * (1.0 + v * base[settings])
+        alice_minus = draws[1] < 0.5
+        bob_minus = alice_minus ^ disagree
+        yield (settings * 4 + 2 * alice_minus + bob_minus).astype(np.uint8)
+        done += size
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from eac.accumulate import CHSHAccumulator
+from eac.states import werner_state
+
+ANGLES = ((0.0, np.pi / 2), (np.pi / 4, -np.pi / 4))
+
+
+def test_resumed_run_matches_uninterrupted_run(tmp_path):
+    state = werner_state(0.9)
+    full = CHSHAccumulator(ANGLES, rng=np.random.default_rng(3))
+    full.run(state, 50_001, block_size=10_000)
+
+    path = tmp_path / "run.json"
+    first = CHSHAccumulator(ANGLES, rng=np.random.default_rng(3))
+    first.run(state, 30_000, block_size=10_000, checkpoint=path)
+    resumed = CHSHAccumulator.load(path)
+    resumed.run(state, 20_001, block_size=10_000)
+
+    np.testing.assert_array_equal(resumed.table, full.table)
+    assert resumed.shots == 50_001
+    assert path.stat().st_size < 4_096
+    assert abs(full.chsh_value().value - 0.9 * 2 * np.sqrt(2)) < 0.1
+    assert full.no_signaling()["max_deviation"] < 0.05
+
+
+def test_shards_merge_by_adding_counts():
+    state = werner_state(0.8)
+    seeds = np.random.SeedSequence(11).spawn(3)
+    shards = [
+        CHSHAccumulator(ANGLES, rng=np.random.default_rng(seed)).run(state, 4_000)
+        for seed in seeds
+    ]
+    merged = shards[0].merge(*shards[1:])
+    np.testing.assert_array_equal(merged.table, sum(s.table for s in shards))
+    assert all(merged.rng is not s.rng for s in shards)
+    assert (shards[0] + shards[1]).shots == 8_000
+    assert merged.chsh_value().shots == 12_000
+
+    other = CHSHAccumulator(((0.0, 1.0), (0.5, -0.5)))
+    with pytest.raises(ValueError):
+        merged.merge(other)
+
+
+def test_add_codes_rejects_out_of_range_codes():
+    accumulator = CHSHAccumulator(ANGLES)
+    accumulator.add_codes(np.array([0, 5, 15], dtype=np.uint8))
+    for bad in ([16], [-1], [256], [1.5]):
+        with pytest.raises(ValueError):
+            accumulator.add_codes(bad)
+    assert accumulator.shots == 3
+
+
+def test_random_schedule_resume_ignores_block_boundaries(tmp_path):
+    state = werner_state(0.7)
+    full = CHSHAccumulator(ANGLES, rng=np.random.default_rng(8))
+    full.run(state, 25_000, block_size=25_000, schedule="random")
+
+    path = tmp_path / "run.json"
+    interrupted = CHSHAccumulator(ANGLES, rng=np.random.default_rng(8))
+
+    def save_then_crash(target):
+        if interrupted.shots > 3_500:
+            raise KeyboardInterrupt
+        CHSHAccumulator.save(interrupted, target)
+
+    interrupted.save = save_then_crash
+    with pytest.raises(KeyboardInterrupt):
+        interrupted.run(state, 25_000, block_size=3_500, schedule="random", checkpoint=path)
+
+    resumed = CHSHAccumulator.load(path)
+    assert resumed.shots == 3_500 and resumed.pending["target"] == 25_000
+    with pytest.raises(ValueError):
+        resumed.run(state, schedule="cycle")
+    with pytest.raises(ValueError):
+        resumed.run(werner_state(0.6), schedule="random")
+    with pytest.raises(ValueError):
+        resumed.run(state, 1_000, schedule="random")
+    resumed.run(state, block_size=4_000, schedule="random")
+
+    np.testing.assert_array_equal(resumed.table, full.table)
+    assert resumed.pending is None
@@ -0,0 +1,74 @@
+import asyncio
+
+import numpy as np
+
+from eac.aio import CHSHBroadcast, achsh_stream
+from eac.simulate import chsh_stream
+from eac.states import bell_state
+
+ANGLES = ((0.0, np.pi / 2), (np.pi / 4, -np.pi / 4))
+
+
+def test_achsh_stream_matches_block_stream():
+    state = bell_state("Phi+")
+
+    async def collect():
+        rng = np.random.default_rng(5)
+        return [s async for s in achsh_stream(state, ANGLES, shots=1_000, block_size=300, rng=rng)]
+
+    records = asyncio.run(collect())
+    expected = list(
+        chsh_stream(state, ANGLES, shots=1_000, block_size=300, rng=np.random.default_rng(5))
+    )
+    assert records == expected
+
+
+def test_broadcast_fans_out_with_backpressure_and_cancellation():
+    state = bell_state("Phi+")
+
+    async def run():
+        broadcast = CHSHBroadcast(state, ANGLES, shots=20_000, block_size=1_000)
+        every = broadcast.subscribe(maxsize=1, policy="wait")
+        latest = broadcast.subscribe(maxsize=2, policy="coalesce")
+        dropped = broadcast.subscribe(maxsize=1, policy="drop")
+
+        async def slow(sub):
+            seen = []
+            async for snapshot in sub:
+                seen.append(snapshot["shot"])
+                await asyncio.sleep(0.01)
+            return seen
+
+        async with broadcast:
+            all_shots = [s["shot"] async for s in every]
+            coalesced = await slow(latest)
+            kept = await slow(dropped)
+        late = [s["shot"] async for s in broadcast.subscribe()]
+
+        cancelled = CHSHBroadcast(state, ANGLES, shots=10**9, block_size=1_000)
+        sub = cancelled.subscribe(maxsize=1)
+        async with cancelled:
+            first = await sub.__anext__()
+        rest = [s async for s in sub]
+        return all_shots, coalesced, kept, dropped.dropped, late, first, rest
+
+    all_shots, coalesced, kept, n_dropped, late, first, rest = asyncio.run(run())
+    assert all_shots == list(range(1_000, 20_001, 1_000))
+    assert coalesced[-1] == 20_000 and len(coalesced) <= 20
+    assert len(kept) + n_dropped == 20
+    assert late == [20_000]
+    assert first["shot"] == 1_000 and len(rest) <= 1
+
+
+def test_subscribe_before_the_loop_starts():
+    broadcast = CHSHBroadcast(bell_state("Phi+"), ANGLES, shots=3_000, block_size=1_000)
+    subscription = broadcast.subscribe(maxsize=1, policy="wait")
+
+    async def run():
+        async with broadcast:
+            return [s["shot"] async for s in subscription]
+
+    assert asyncio.run(run()) == [1_000, 2_000, 3_000]
+    # A second loop can still read the finished run through a fresh subscription.
+    late = broadcast.subscribe()
+    assert asyncio.run(late.__anext__())["shot"] == 3_000
@@ -0,0 +1,31 @@
+import numpy as np
+
+from eac.audit import TESTS, audit_counts, no_signaling_audit
+from eac.states import State, bell_state, werner_state
+
+ANGLES = ((0.0, np.pi / 2), (np.pi / 4, -np.pi / 4))
+
+
+def test_audit_batches_states_and_angles_with_calibrated_p_values():
+    states = [bell_state("Phi+"), State.werner(0.7, singlet="Psi-"), werner_state(0.0)]
+    rng = np.random.default_rng(4)
+    angle_sets = [tuple(map(tuple, rng.uniform(-np.pi, np.pi, (2, 2)))) for _ in range(400)]
+    result = no_signaling_audit(states, angle_sets, shots=2_000, rng=rng)
+
+    assert result.counts.shape == (3, 400, 4, 4)
+    assert result.z.shape == (3, 400, len(TESTS))
+    assert np.all(result.counts.sum(axis=-1) == 2_000)
+    assert result.max_deviation.max() < 0.1
+    # Under no-signaling the per-test p-values are roughly uniform.
+    assert 0.02 < np.mean(result.p_values < 0.05) < 0.08
+    assert np.mean(result.flagged(0.01)) < 0.03
+
+
+def test_audit_flags_a_signaling_table():
+    fair = np.full((4, 4), 250)
+    signaling = fair.copy()
+    signaling[1] = [400, 250, 100, 250]  # Alice's marginal at a depends on b'.
+    result = audit_counts(np.stack([fair, signaling]))
+    assert not result.flagged()[0] and result.flagged()[1]
+    assert result.z[1, TESTS.index("alice@a")] < -5
+    assert result.p_values[1, TESTS.index("bob@b")] == 1.0
@@ -0,0 +1,13 @@
+import numpy as np
+
+from eac.measure import sample_outcomes
+from eac.states import bell_state
+
+
+def test_batch_sampler_returns_perfectly_correlated_int8_arrays():
+    rng = np.random.default_rng(11)
+    alice, bob = sample_outcomes(bell_state(), 0.3, 0.3, 5_000, rng=rng)
+    assert alice.dtype == np.int8 and bob.dtype == np.int8
+    assert alice.shape == bob.shape == (5_000,)
+    assert np.array_equal(alice, bob)
+    assert abs(np.mean(alice == 1) - 0.5) < 0.03
@@ -0,0 +1,33 @@
+import json
+
+from eac.bench import compare, default_cases, main, run_benchmarks, to_json
+
+
+def test_bench_runner_reports_throughput_and_detects_regressions(tmp_path):
+    names = {"chsh_value", "sample_outcome", "werner_sweep"}
+    cases = [case for case in default_cases() if case.name in names]
+    results = run_benchmarks(cases, shot_counts=(1_000, 100_000), repeat=1)
+    # The sweep splits shots over 101 visibilities x 4 settings and reports what it drew.
+    assert [(r.name, r.shots) for r in results] == [
+        ("sample_outcome", 1_000),
+        ("chsh_value", 1_000),
+        ("chsh_value", 100_000),
+        ("werner_sweep", 808),
+        ("werner_sweep", 99_788),
+    ]
+    assert all(r.shots_per_second > 0 and r.peak_bytes >= 0 for r in results)
+
+    report = to_json(results)
+    slower = json.loads(json.dumps(report))
+    for entry in slower["results"]:
+        entry["shots_per_second"] /= 2
+    assert len(compare(report, slower)) == 5
+    assert compare(slower, report) == []
+
+    out = tmp_path / "bench.json"
+    only = ["--only", "chsh_exact[werner]", "chsh_exact[density]"]
+    assert main(["--out", str(out), "--shots", "1000", "--repeat", "1", *only]) == 0
+    exact = json.loads(out.read_text())["results"]
+    assert {r["name"] for r in exact} == {"chsh_exact[werner]", "chsh_exact[density]"}
+    assert all(r["shots_per_second"] is None and r["evaluations_per_second"] > 0 for r in exact)
+    assert [r["evaluations"] for r in exact[:3]] == [10, 100, 1_000]
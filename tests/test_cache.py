@@ -0,0 +1,63 @@
+import os
+
+import numpy as np
+
+from eac.cache import ResultCache
+from eac.chsh import chsh_value
+from eac.states import bell_state, werner_state
+
+ANGLES = ((0.0, np.pi / 2), (np.pi / 4, -np.pi / 4))
+
+
+def test_cache_reuses_seeded_results_and_keys_on_inputs(tmp_path):
+    cache = ResultCache(tmp_path)
+    state = werner_state(0.9)
+    first = cache.chsh_value(state, ANGLES, shots=2_000, seed=5)
+    again = cache.chsh_value(state.copy(), ANGLES, shots=2_000, seed=5)
+    assert again == first == chsh_value(state, ANGLES, shots=2_000, rng=np.random.default_rng(5))
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.chsh_value(state, ANGLES, shots=2_000, seed=6)
+    cache.chsh_value(werner_state(0.8), ANGLES, shots=2_000, seed=5)
+    cache.chsh_value(state, ANGLES, shots=2_000)
+    assert cache.misses == 3 and len(os.listdir(cache.directory)) == 3
+
+    sweep = cache.werner_sweep(np.linspace(0, 1, 5), ANGLES, shots=1_000, seed=1)
+    np.testing.assert_array_equal(
+        cache.werner_sweep([0, 0.25, 0.5, 0.75, 1.0], ANGLES, shots=1_000, seed=1).counts,
+        sweep.counts,
+    )
+    assert cache.chsh_exact(bell_state("Phi+"), ANGLES).value > 2.8
+    assert cache.hits == 2
+
+
+def test_cache_evicts_least_recently_used_across_versions(tmp_path):
+    old = ResultCache(tmp_path, version="old")
+    old_key = old.key("n", seed=0)
+    old.put(old_key, "stale")
+    cache = ResultCache(tmp_path, max_bytes=10**6)
+    assert cache.get(old_key) is None and old.get(old_key) == "stale"
+    os.utime(os.path.join(old.directory, old_key + ".pkl"), (0, 0))
+
+    keys = [cache.key("n", seed=i) for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, i)
+        path = os.path.join(cache.directory, key + ".pkl")
+        os.utime(path, (i, i))
+    cache.get(keys[0])
+    size = os.path.getsize(os.path.join(cache.directory, keys[0] + ".pkl"))
+    cache.max_bytes = 2 * size
+    cache.evict()
+    assert not os.listdir(old.directory)
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == 0 and cache.get(keys[2]) == 2
+
+
+def test_unloadable_entry_is_a_miss(tmp_path):
+    cache = ResultCache(tmp_path)
+    key = cache.key("n")
+    with open(os.path.join(cache.directory, key + ".pkl"), "wb") as handle:
+        # A pickled reference to a module that does not exist.
+        handle.write(b"cno_such_module\nThing\n.")
+    assert cache.get_or_compute(key, lambda: 7) == 7
+    assert (cache.hits, cache.misses) == (0, 1) and cache.get(key) == 7
@@ -0,0 +1,33 @@
+import math
+
+import numpy as np
+
+from eac.simulate import _setting_pairs, _snapshot, chsh_stream
+from eac.states import bell_state
+
+
+ANGLES = (
+    (0.0, math.pi / 2),
+    (math.pi / 4, -math.pi / 4),
+)
+
+
+def test_block_stream_yields_one_snapshot_per_block():
+    rng = np.random.default_rng(3)
+    records = list(chsh_stream(bell_state(), ANGLES, shots=20_500, rng=rng, block_size=1_000))
+    assert [r["shot"] for r in records][-2:] == [20_000, 20_500]
+    assert len(records) == 21
+    final = records[-1]
+    assert abs(final["running_s"] - 2 * math.sqrt(2)) < 0.1
+    per_shot = next(chsh_stream(bell_state(), ANGLES, shots=1, rng=rng))
+    assert final.keys() == per_shot.keys()
+    assert all(abs(p - 0.5) < 0.05 for p in final["marginals"]["alice"].values())
+
+
+def test_block_marginals_pool_rows_when_local_angles_coincide():
+    angles = ((0.0, 0.0), (math.pi / 4, -math.pi / 4))
+    counts = np.array([[10, 0, 0, 0], [10, 0, 0, 0], [0, 0, 0, 10], [0, 0, 0, 10]])
+    record = _snapshot(40, _setting_pairs(angles), angles, counts, 3, 3)
+    assert record["marginals"]["alice"] == {0.0: 0.5}
+    per_shot = list(chsh_stream(bell_state(), angles, shots=8, rng=np.random.default_rng(1)))
+    assert list(per_shot[-1]["marginals"]["alice"]) == [0.0]
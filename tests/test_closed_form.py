@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+from eac.chsh import correlation_exact
+from eac.measure import joint_probabilities, joint_projectors
+from eac.states import werner_state, werner_structure
+
+
+@pytest.mark.parametrize("label", ["Phi+", "Phi-", "Psi+", "Psi-"])
+def test_werner_fast_path_matches_density_matrix_path(label):
+    state = werner_state(0.6, singlet=label)
+    assert werner_structure(state) == (label, pytest.approx(0.6))
+    rng = np.random.default_rng(4)
+    for theta_a, theta_b in rng.uniform(-np.pi, np.pi, size=(10, 2)):
+        general = np.real(np.einsum("kij,ji->k", joint_projectors(theta_a, theta_b), state))
+        assert joint_probabilities(state, theta_a, theta_b) == pytest.approx(general, abs=1e-12)
+        expected = general @ np.array([1.0, -1.0, -1.0, 1.0])
+        assert correlation_exact(state, theta_a, theta_b).value == pytest.approx(expected)
+    assert werner_structure(np.diag([0.5, 0.5, 0.0, 0.0])) is None
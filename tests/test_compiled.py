@@ -0,0 +1,29 @@
+import math
+
+import numpy as np
+import pytest
+
+from eac.chsh import chsh_exact
+from eac.compiled import CompiledCHSH
+from eac.states import werner_state
+
+
+ANGLES = (
+    (0.0, math.pi / 2),
+    (math.pi / 4, -math.pi / 4),
+)
+
+
+def test_compiled_experiment_matches_direct_routines():
+    state = werner_state(0.9)
+    compiled = CompiledCHSH(state, ANGLES)
+    assert compiled.exact().value == pytest.approx(chsh_exact(state, ANGLES).value)
+    rng = np.random.default_rng(21)
+    estimate = compiled.chsh_value(shots=200_000, rng=rng)
+    assert abs(estimate.value - 0.9 * 2 * math.sqrt(2)) < 0.02
+    settings, alice, bob = compiled.sample(8, rng=rng)
+    assert settings.tolist() == [0, 1, 2, 3, 0, 1, 2, 3]
+    assert set(alice.tolist()) <= {-1, 1} and set(bob.tolist()) <= {-1, 1}
+    final = list(compiled.stream(shots=4_000, rng=rng, block_size=1_000))[-1]
+    assert final["shot"] == 4_000
+    assert compiled.no_signaling(shots=40_000, rng=rng)["max_deviation"] < 0.03
@@ -0,0 +1,24 @@
+import math
+
+import numpy as np
+import pytest
+
+from eac.chsh import chsh_exact, chsh_exact_grid, correlation_exact, correlation_exact_grid
+from eac.states import werner_state
+
+
+def test_grid_evaluation_matches_scalar_exact_routines():
+    state = werner_state(0.8, singlet="Psi+")
+    theta = np.linspace(-math.pi, math.pi, 7)
+    grid = correlation_exact_grid(state, theta[:, None], theta[None, :])
+    assert grid.shape == (7, 7)
+    assert grid[2, 5] == pytest.approx(correlation_exact(state, theta[2], theta[5]).value)
+
+    visibilities = np.linspace(0.0, 1.0, 5)
+    stack = np.stack([werner_state(v) for v in visibilities])
+    angles = ((0.0, math.pi / 2), (math.pi / 4, np.array([-math.pi / 4, 0.1])))
+    values = chsh_exact_grid(stack, angles)
+    assert values.shape == (5, 2)
+    expected = chsh_exact(werner_state(0.75), ((0.0, math.pi / 2), (math.pi / 4, 0.1))).value
+    assert values[3, 1] == pytest.approx(expected)
+    assert values[:, 0] == pytest.approx(visibilities * 2 * math.sqrt(2))
@@ -0,0 +1,35 @@
+import numpy as np
+
+from eac.chsh import DEFAULT_ANGLES, chsh_value
+from eac.instrument import add_hook, instrument, stage
+from eac.measure import clear_operator_cache
+from eac.simulate import chsh_stream
+from eac.states import State
+
+
+def test_instrument_records_stages_only_while_enabled():
+    state = np.array([np.cos(0.3), 0.0, 0.0, np.sin(0.3)], dtype=np.complex128)
+    clear_operator_cache()
+    with instrument() as recorder:
+        chsh_value(state, DEFAULT_ANGLES, shots=500, rng=np.random.default_rng(1))
+        State(state)
+        list(chsh_stream(state, DEFAULT_ANGLES, shots=40, block_size=16))
+    stats = recorder.stats
+    assert stats["chsh.value"].calls == 1 and stats["chsh.value"].shots == 2_000
+    assert stats["chsh.correlation"].calls == 4
+    assert stats["measure.rng"].shots == 2_000
+    assert stats["measure.kron"].calls == 4 and stats["measure.projector"].calls == 4
+    assert stats["states.validate"].calls == 1
+    assert stats["simulate.block"].calls == 3 and stats["simulate.block"].shots == 40
+    assert all(s.seconds >= 0.0 for s in stats.values())
+
+    seen = []
+    remove = add_hook(lambda name, seconds, shots: seen.append((name, shots)))
+    with stage("custom", shots=7):
+        pass
+    remove()
+    assert seen == [("custom", 7)]
+
+    chsh_value(state, DEFAULT_ANGLES, shots=100)
+    assert stats["chsh.value"].calls == 1
+    assert seen == [("custom", 7)]
@@ -0,0 +1,24 @@
+import itertools
+
+import numpy as np
+
+from eac.local import deterministic_strategy, lhv_chsh_value, optimal_strategy, random_strategy
+
+
+def test_deterministic_strategies_never_exceed_local_bound():
+    rng = np.random.default_rng(1)
+    values = [
+        lhv_chsh_value(deterministic_strategy(row), shots=8, rng=rng).value
+        for row in itertools.product((-1, 1), repeat=4)
+    ]
+    assert max(values) == 2.0
+    assert lhv_chsh_value(optimal_strategy, shots=400, rng=rng).value == 2.0
+
+
+def test_random_strategy_counts_cover_every_shot():
+    rng = np.random.default_rng(2)
+    result = lhv_chsh_value(
+        random_strategy, shots=1_000_003, schedule="random", rng=rng, chunk_size=250_000
+    )
+    assert sum(c.shots for c in result.counts) == 1_000_003
+    assert abs(result.value) < 0.02
@@ -0,0 +1,69 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from eac.measure import joint_probabilities
+from eac.uncertainty import bootstrap, standard_error
+from eac.multipartite import (
+    cglmp_exact,
+    cglmp_value,
+    ghz_state,
+    local_probabilities,
+    max_entangled_qudits,
+    mermin_exact,
+    mermin_local_bound,
+    mermin_value,
+)
+
+
+def test_local_probabilities_match_two_qubit_measure_convention():
+    vec = np.array([0.6, 0.1, 0.3, 0.7])
+    vec = vec / np.linalg.norm(vec)
+    expected = joint_probabilities(vec, 0.3, 1.1)
+    assert local_probabilities(vec, [0.3, 1.1]) == pytest.approx(expected)
+    rho = np.outer(vec, vec.conj())
+    assert local_probabilities(rho, [0.3, 1.1]) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("n_qubits", [3, 4, 5])
+def test_ghz_mermin_violation(n_qubits):
+    state = ghz_state(n_qubits)
+    assert mermin_exact(state, n_qubits).value == pytest.approx(2 ** (n_qubits - 1))
+    sampled = mermin_value(state, n_qubits, shots=500, rng=np.random.default_rng(n_qubits))
+    assert sampled.value > mermin_local_bound(n_qubits)
+
+
+def test_cglmp_qutrit_violation():
+    state = max_entangled_qudits(3)
+    assert cglmp_exact(state, 3).value == pytest.approx(2.8729, abs=1e-4)
+    assert cglmp_exact(max_entangled_qudits(2), 2).value == pytest.approx(2 * np.sqrt(2))
+    assert cglmp_value(state, 3, shots=50_000, rng=np.random.default_rng(3)).value > 2.7
+
+
+def test_mermin_checks_qubit_count_and_results_support_uncertainty():
+    with pytest.raises(ValueError):
+        mermin_exact(ghz_state(3), 5)
+    assert mermin_exact(ghz_state(4)).value == pytest.approx(8.0)
+    rng = np.random.default_rng(2)
+    mermin = mermin_value(ghz_state(3), shots=2_000, rng=rng)
+    assert mermin.case_counts.shape == (4, 2) and mermin.case_counts.sum() == mermin.shots
+    assert mermin.counts == () and sum(c.shots for c in mermin.counts) == 0
+    cglmp = cglmp_value(max_entangled_qudits(3), 3, shots=5_000, rng=rng)
+    for result in (mermin, cglmp):
+        boot = bootstrap(result, replicates=500, seed=1)
+        assert boot.estimate == pytest.approx(result.value)
+        assert standard_error(result) == pytest.approx(boot.stderr, rel=0.2)
+    assert standard_error(cglmp) > 0
+
+
+def test_linear_results_compare_by_value_and_round_trip():
+    first = mermin_value(ghz_state(3), shots=1_000, rng=np.random.default_rng(4))
+    again = mermin_value(ghz_state(3), shots=1_000, rng=np.random.default_rng(4))
+    assert first == again
+    assert pickle.loads(pickle.dumps(first)) == first
+    assert first != mermin_exact(ghz_state(3))
+    qutrits = max_entangled_qudits(3)
+    cglmp = cglmp_value(qutrits, 3, shots=1_000, rng=np.random.default_rng(4))
+    assert cglmp == pickle.loads(pickle.dumps(cglmp))
+    assert cglmp != cglmp_value(qutrits, 3, shots=1_000, rng=np.random.default_rng(5))
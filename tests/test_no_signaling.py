@@ -16,3 +16,11 @@ def test_no_signaling_marginals_stay_balanced():
     rng = np.random.default_rng(99)
     report = check_no_signaling(bell_state(), ANGLES, shots=40_000, rng=rng)
     assert report["max_deviation"] < 0.02
+
+
+def test_no_signaling_draws_each_setting_once():
+    report = check_no_signaling(bell_state(), ANGLES, shots=30_000, rng=np.random.default_rng(4))
+    ab, ab_prime, a_prime_b = report["counts"]
+    assert [c.shots for c in report["counts"]] == [10_000] * 3
+    assert report["alice"]["b"] == ab.alice_plus and report["bob"]["a"] == ab.bob_plus
+    assert abs(report["z"]["alice"]) < 4 and report["p_values"]["bob"] > 1e-4
@@ -0,0 +1,30 @@
+import math
+
+import numpy as np
+import pytest
+
+from eac.chsh import chsh_exact
+from eac.measure import clear_operator_cache, operator_cache_info, projector
+from eac.states import bell_state
+
+
+ANGLES = (
+    (0.0, math.pi / 2),
+    (math.pi / 4, -math.pi / 4),
+)
+
+
+def test_exact_chsh_reuses_cached_read_only_operators():
+    # A partially entangled state is not a Werner state, so it takes the operator path.
+    state = np.array([math.cos(0.3), 0.0, 0.0, math.sin(0.3)])
+    clear_operator_cache()
+    first = chsh_exact(state, ANGLES).value
+    second = chsh_exact(state, ANGLES).value
+    assert chsh_exact(bell_state(), ANGLES).value == pytest.approx(2 * math.sqrt(2))
+    assert second == first
+    info = operator_cache_info()["joint"]
+    assert info.misses == 4 and info.hits == 4
+    p_plus, _ = projector(0.0)
+    with pytest.raises(ValueError):
+        p_plus[0, 0] = 0.0
+    assert np.allclose(p_plus, [[1, 0], [0, 0]])
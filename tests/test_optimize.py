@@ -0,0 +1,36 @@
+import math
+
+import numpy as np
+import pytest
+
+from eac.chsh import DEFAULT_ANGLES, chsh_exact, chsh_exact_grid
+from eac.optimize import horodecki_max, optimal_angles
+from eac.states import werner_state
+
+
+def test_optimizer_reaches_horodecki_bound_for_werner_states():
+    for label in ("Phi+", "Phi-", "Psi+", "Psi-"):
+        state = werner_state(0.8, singlet=label)
+        best = optimal_angles(state)
+        assert best.value == pytest.approx(0.8 * 2 * math.sqrt(2))
+        assert best.horodecki == pytest.approx(best.value)
+        assert chsh_exact(state, best.angles).value == pytest.approx(best.value)
+    assert optimal_angles(werner_state(1.0)).value == pytest.approx(
+        chsh_exact(werner_state(1.0), DEFAULT_ANGLES).value
+    )
+
+
+def test_batch_optimisation_beats_brute_force_grid():
+    rng = np.random.default_rng(12)
+    mats = rng.normal(size=(6, 4, 4)) + 1j * rng.normal(size=(6, 4, 4))
+    stack = mats @ np.conj(np.swapaxes(mats, -1, -2))
+    stack /= np.trace(stack, axis1=-2, axis2=-1)[:, None, None]
+    best = optimal_angles(stack)
+    assert best.angles.shape == (6, 2, 2)
+    grid = np.linspace(-np.pi, np.pi, 17)
+    a, a_p, b, b_p = np.meshgrid(grid, grid, grid, grid, indexing="ij")
+    brute = chsh_exact_grid(stack, ((a, a_p), (b, b_p))).reshape(6, -1).max(axis=1)
+    assert np.all(best.value >= brute - 1e-9)
+    assert np.all(best.value <= horodecki_max(stack) + 1e-9)
+    for state, angles, value in zip(stack, best.angles, best.value):
+        assert chsh_exact(state, angles).value == pytest.approx(value)
@@ -0,0 +1,33 @@
+import numpy as np
+
+from eac.compiled import CompiledCHSH
+from eac.packed import PackedShots
+from eac.states import werner_state
+
+
+ANGLES = (
+    (0.0, np.pi / 2),
+    (np.pi / 4, -np.pi / 4),
+)
+
+
+def test_packed_reductions_match_unpacked_arrays():
+    rng = np.random.default_rng(13)
+    settings, alice, bob = CompiledCHSH(werner_state(0.8), ANGLES).sample(
+        100_001, schedule="random", rng=rng
+    )
+    packed = PackedShots.from_arrays(settings, alice, bob)
+    assert packed.nbytes == 50_001
+    unpacked = packed.arrays()
+    assert all(np.array_equal(x, y) for x, y in zip(unpacked, (settings, alice, bob)))
+
+    table = packed.count_table()
+    assert table.sum() == 100_001
+    for k in range(4):
+        mask = settings == k
+        assert table[k].sum() == mask.sum()
+        assert np.isclose(packed.correlations()[k], np.mean(alice[mask] * bob[mask]))
+        assert np.isclose(packed.marginals()[0][k], np.mean(alice[mask] == 1))
+
+    joined = PackedShots.concatenate([packed, packed])
+    assert np.array_equal(joined.count_table(), 2 * table)
@@ -0,0 +1,23 @@
+import math
+
+from eac.parallel import parallel_chsh_value, parallel_check_no_signaling
+from eac.states import bell_state
+
+
+ANGLES = (
+    (0.0, math.pi / 2),
+    (math.pi / 4, -math.pi / 4),
+)
+
+
+def test_parallel_runs_are_reproducible_across_executors():
+    threaded = parallel_chsh_value(bell_state(), ANGLES, shots=100_001, seed=42, workers=3)
+    again = parallel_chsh_value(bell_state(), ANGLES, shots=100_001, seed=42, workers=3)
+    processes = parallel_chsh_value(
+        bell_state(), ANGLES, shots=100_001, seed=42, workers=3, executor="process"
+    )
+    assert threaded.counts == again.counts == processes.counts
+    assert sum(c.shots for c in threaded.counts) == 4 * 100_001
+    assert threaded.value > 2.7
+    report = parallel_check_no_signaling(bell_state(), ANGLES, shots=40_000, seed=42, workers=2)
+    assert report["max_deviation"] < 0.03
@@ -0,0 +1,22 @@
+import math
+
+import numpy as np
+
+from eac.chsh import chsh_value
+from eac.states import bell_state
+
+
+ANGLES = (
+    (0.0, math.pi / 2),
+    (math.pi / 4, -math.pi / 4),
+)
+
+
+def test_count_mode_handles_huge_shot_budgets():
+    rng = np.random.default_rng(5)
+    result = chsh_value(bell_state(), ANGLES, shots=10**12, rng=rng)
+    assert result.shots == 4 * 10**12
+    assert len(result.counts) == 4
+    assert sum(c.shots for c in result.counts) == result.shots
+    assert abs(result.value - 2 * math.sqrt(2)) < 1e-4
+    assert all(c.correlation_stderr < 1e-5 for c in result.counts)
@@ -0,0 +1,23 @@
+import math
+
+import numpy as np
+
+from eac.simulate import chsh_sequential_test
+from eac.states import bell_state, werner_state
+
+
+ANGLES = (
+    (0.0, math.pi / 2),
+    (math.pi / 4, -math.pi / 4),
+)
+
+
+def test_sequential_test_stops_early_with_the_right_decision():
+    rng = np.random.default_rng(2024)
+    bell = chsh_sequential_test(bell_state(), ANGLES, rng=rng)
+    assert bell.decision == "violation"
+    assert bell.lower > 2.0
+    assert bell.shots <= 10_000
+    noisy = chsh_sequential_test(werner_state(0.5), ANGLES, rng=rng)
+    assert noisy.decision == "no_violation"
+    assert noisy.upper <= 2.0
@@ -0,0 +1,65 @@
+import math
+
+import numpy as np
+import pytest
+
+from eac.chsh import chsh_value, check_no_signaling, correlation
+from eac.shotlog import ShotLog, ShotLogWriter
+from eac.simulate import record_shot_log
+from eac.states import bell_state
+
+
+ANGLES = (
+    (0.0, math.pi / 2),
+    (math.pi / 4, -math.pi / 4),
+)
+
+
+def test_recorded_log_replays_through_the_estimators(tmp_path):
+    path = tmp_path / "run.eacshots"
+    log = record_shot_log(path, bell_state(), ANGLES, shots=200_003, seed=9, block_size=50_000)
+    assert log.shots == 200_003
+    assert path.stat().st_size < 200_003 + 1_024
+
+    replay = ShotLog(path, chunk_size=30_000)
+    scans = []
+    scan = replay._scan_counts
+    replay._scan_counts = lambda: scans.append(1) or scan()
+    assert replay.seed == 9
+    assert np.allclose(replay.state, bell_state())
+    result = chsh_value(replay, replay.angles)
+    assert result.shots == 200_003
+    assert abs(result.value - 2 * math.sqrt(2)) < 0.03
+    assert correlation(replay, math.pi / 2, -math.pi / 4).counts[0] == result.counts[3]
+    report = check_no_signaling(replay, ANGLES)
+    assert report["max_deviation"] < 0.02
+    assert len(scans) == 1
+
+
+def test_writer_round_trips_settings_and_outcomes(tmp_path):
+    path = tmp_path / "manual.eacshots"
+    settings = np.array([0, 1, 2, 3, 3], dtype=np.int8)
+    alice = np.array([1, -1, 1, -1, 1], dtype=np.int8)
+    bob = np.array([1, 1, -1, -1, 1], dtype=np.int8)
+    with ShotLogWriter(path, ANGLES) as writer:
+        writer.write(settings, alice, bob)
+    table = ShotLog(path).count_table()
+    assert table.sum() == 5
+    assert table[3].tolist() == [1, 0, 0, 1]
+
+
+def test_replay_reads_rows_by_position_when_settings_coincide(tmp_path):
+    angles = ((0.0, 0.0), (math.pi / 4, -math.pi / 4))
+    path = tmp_path / "same-a.eacshots"
+    record_shot_log(path, bell_state(), angles, shots=4_000, seed=2, block_size=1_000)
+    replay = ShotLog(path)
+    table = replay.count_table()
+
+    result = chsh_value(replay, angles)
+    assert result.shots == 4_000
+    assert [c.as_array().tolist() for c in result.counts] == table.tolist()
+    pooled = correlation(replay, 0.0, math.pi / 4).counts[0]
+    assert pooled.as_array().tolist() == (table[0] + table[2]).tolist()
+    assert check_no_signaling(replay, angles)["counts"][2].as_array().tolist() == table[2].tolist()
+    with pytest.raises(ValueError):
+        chsh_value(replay, ANGLES)
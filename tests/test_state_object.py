@@ -0,0 +1,38 @@
+import math
+
+import numpy as np
+import pytest
+
+from eac.chsh import chsh_exact, chsh_value
+from eac.states import State, bell_state, werner_state
+
+
+ANGLES = (
+    (0.0, math.pi / 2),
+    (math.pi / 4, -math.pi / 4),
+)
+
+
+def test_state_validates_once_and_flags_structure():
+    bell = State(bell_state())
+    assert bell.kind == "bell" and bell.is_pure
+    assert bell.structure == ("Phi+", pytest.approx(1.0))
+    noisy = State.werner(0.5, singlet="Psi-")
+    assert noisy.kind == "werner" and noisy.purity == pytest.approx(0.25 + 0.75 * 0.25)
+    assert State(np.diag([0.5, 0.5, 0.0, 0.0])).kind == "mixed"
+    with pytest.raises(ValueError):
+        State(np.diag([1.0, 1.0, 0.0, 0.0]))
+    with pytest.raises(ValueError):
+        State(np.diag([1.5, -0.5, 0.0, 0.0]))
+    with pytest.raises(ValueError):
+        bell.rho[0, 0] = 0.0
+
+
+def test_state_objects_work_across_the_api():
+    state = State.werner(0.9)
+    assert chsh_exact(state, ANGLES).value == pytest.approx(
+        chsh_exact(werner_state(0.9), ANGLES).value
+    )
+    rng = np.random.default_rng(8)
+    assert abs(chsh_value(state, ANGLES, shots=50_000, rng=rng).value - 2.5456) < 0.05
+    assert np.array_equal(np.asarray(state), state.rho)
@@ -0,0 +1,35 @@
+import math
+
+import numpy as np
+import pytest
+
+from eac.chsh import check_no_signaling, chsh_exact, chsh_value
+from eac.states import werner_state
+from eac.uncertainty import bootstrap, standard_error
+
+
+ANGLES = (
+    (0.0, math.pi / 2),
+    (math.pi / 4, -math.pi / 4),
+)
+
+
+def test_bootstrap_agrees_with_analytic_error():
+    rng = np.random.default_rng(17)
+    result = chsh_value(werner_state(0.9), ANGLES, shots=20_000, rng=rng)
+    analytic = standard_error(result)
+    boot = bootstrap(result, replicates=4_000, seed=17)
+    assert boot.replicates.shape == (4_000,)
+    assert boot.estimate == pytest.approx(result.value)
+    assert boot.stderr == pytest.approx(analytic, rel=0.1)
+    assert boot.ci_low < result.value < boot.ci_high
+
+    pooled = bootstrap(result, replicates=4_000, seed=17, workers=2, executor="thread")
+    again = bootstrap(result, replicates=4_000, seed=17, workers=2, executor="thread")
+    assert np.array_equal(pooled.replicates, again.replicates)
+
+    report = check_no_signaling(werner_state(0.9), ANGLES, rng=rng)
+    assert standard_error(report) > 0
+    assert bootstrap(report, replicates=500, seed=1).ci_low >= 0
+    with pytest.raises(ValueError):
+        standard_error(chsh_exact(werner_state(0.9), ANGLES))
@@ -1,9 +1,11 @@
 import math
 
 import numpy as np
+import pytest
 
 from eac.chsh import chsh_value
 from eac.states import werner_state
+from eac.sweep import find_werner_threshold, werner_sweep
 
 
 ANGLES = (
@@ -22,3 +24,36 @@ def test_werner_visibility_crosses_local_bound_near_target():
     target = 1 / math.sqrt(2)
     crossing = min(estimates, key=lambda item: abs(item[1] - 2.0))[0]
     assert abs(crossing - target) < 0.03
+
+
+def test_werner_sweep_crossing_and_intervals():
+    rng = np.random.default_rng(7)
+    visibilities = np.linspace(0.5, 1.0, 12)
+    sweep = werner_sweep(visibilities, ANGLES, shots=25_000, rng=rng)
+    target = 1 / math.sqrt(2)
+    crossing = visibilities[np.argmin(np.abs(sweep.values - 2.0))]
+    assert abs(crossing - target) < 0.03
+    assert sweep.counts.shape == (12, 4, 4)
+    assert np.all(sweep.ci_low < sweep.ci_high)
+    assert np.allclose(sweep.exact, visibilities * 2 * math.sqrt(2))
+
+
+def test_adaptive_threshold_search_beats_grid_budget():
+    rng = np.random.default_rng(7)
+    result = find_werner_threshold(ANGLES, tolerance=0.01, rng=rng)
+    assert result.resolved
+    assert result.lower <= 1 / math.sqrt(2) <= result.upper
+    assert abs(result.visibility - 1 / math.sqrt(2)) < 0.01
+    assert result.upper - result.lower <= 0.02
+    # The 12-point grid above costs 12 * 4 * 25_000 = 1_200_000 shots.
+    assert result.total_shots < 1_200_000
+
+
+def test_threshold_search_checks_the_bracket_and_follows_decreasing_s():
+    rng = np.random.default_rng(3)
+    with pytest.raises(ValueError):
+        find_werner_threshold(((0.0, 0.0), (0.0, 0.0)), rng=rng)
+    with pytest.raises(ValueError):
+        find_werner_threshold(ANGLES, singlet="Psi-", rng=rng)
+    result = find_werner_threshold(ANGLES, singlet="Psi-", bound=-2.0, rng=rng)
+    assert result.lower - 0.01 <= 1 / math.sqrt(2) <= result.upper + 0.01
@@ -0,0 +1,44 @@
+import numpy as np
+
+from eac.packed import N_CODES
+from eac.window import DecayingCHSH, WindowedCHSH, drifting_werner_codes
+
+ANGLES = ((0.0, np.pi / 2), (np.pi / 4, -np.pi / 4))
+
+
+def test_window_and_decay_match_direct_recomputation():
+    rng = np.random.default_rng(2)
+    codes = rng.integers(N_CODES, size=5_000).astype(np.uint8)
+    windowed = WindowedCHSH(ANGLES, window=700)
+    decaying = DecayingCHSH(ANGLES, half_life=300.0)
+    start = 0
+    for size in (1, 50, 699, 3, 1_200, 2_000, 47):
+        windowed.update(codes[start:start + size])
+        decaying.update(codes[start:start + size])
+        start += size
+        recent = codes[max(0, start - 700):start]
+        np.testing.assert_array_equal(windowed.table.ravel(), np.bincount(recent, minlength=16))
+    ages = np.arange(start - 1, -1, -1)
+    weights = 0.5 ** (ages / 300.0)
+    expected = np.bincount(codes[:start], weights=weights, minlength=16)
+    np.testing.assert_allclose(decaying.table.ravel(), expected)
+    assert windowed.shots == 700 and windowed.chsh() is not None
+    assert set(windowed.snapshot()["marginals"]["alice"]) == {0.0, np.pi / 2}
+
+
+def test_windowed_estimate_tracks_a_drifting_source():
+    shots = 400_000
+    drift = lambda t: 1.0 - 0.5 * t / shots  # noqa: E731
+    windowed = WindowedCHSH(ANGLES, window=40_000)
+    decaying = DecayingCHSH(ANGLES, half_life=10_000)
+    cumulative = WindowedCHSH(ANGLES, window=shots)
+    source = drifting_werner_codes(
+        drift, ANGLES, shots=shots, block_size=50_000, rng=np.random.default_rng(7)
+    )
+    for block in source:
+        for estimator in (windowed, decaying, cumulative):
+            estimator.update(block)
+    late = 2 * np.sqrt(2) * 0.525
+    assert abs(windowed.chsh() - late) < 0.05
+    assert abs(decaying.chsh() - 2 * np.sqrt(2) * 0.518) < 0.08
+    assert cumulative.chsh() > 2.0 > windowed.chsh()